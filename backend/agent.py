@@ -6,9 +6,10 @@ import json
 import logging
 import os
 from datetime import datetime
-from typing import List, Dict, Optional, Any
+from typing import IO, List, Dict, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
 import numpy as np
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,30 @@ class AgentState:
         """Create AgentState from dictionary"""
         return cls(**data)
 
+    def dump(self, fp: IO[bytes]) -> None:
+        """
+        Write state as JSON to an open binary file
+
+        Args:
+            fp: Writable binary file-like object
+        """
+        fp.write(orjson.dumps(
+            self.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ))
+
+    @classmethod
+    def read(cls, fp: IO[bytes]) -> 'AgentState':
+        """
+        Read state from an open binary file written by dump()
+
+        Args:
+            fp: Readable binary file-like object
+
+        Returns:
+            AgentState instance
+        """
+        return cls.from_dict(orjson.loads(fp.read()))
+
     def save(self, path: str) -> None:
         """
         Persist state to JSON file
@@ -62,8 +87,8 @@ class AgentState:
 
             # Write atomically with temp file
             temp_path = path + '.tmp'
-            with open(temp_path, 'w') as f:
-                json.dump(self.to_dict(), f, indent=2)
+            with open(temp_path, 'wb') as f:
+                self.dump(f)
 
             # Atomic rename
             os.replace(temp_path, path)
@@ -89,10 +114,10 @@ class AgentState:
             return cls()
 
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
+            with open(path, 'rb') as f:
+                state = cls.read(f)
             logger.info(f"Agent state loaded from {path}")
-            return cls.from_dict(data)
+            return state
         except Exception as e:
             logger.error(f"Failed to load agent state: {e}, creating new state")
             return cls()
@@ -181,17 +206,18 @@ class GridMonitorAgent:
         detected_issues = []
         timestamp = datetime.utcnow().isoformat()
 
-        # Add current state to history
+        # Add current state to history (copy the summary so a reused payload
+        # cannot rewrite earlier snapshots)
         self.state.history.append({
             'timestamp': timestamp,
-            'summary': current_data.get('summary', {}),
+            'summary': dict(current_data.get('summary', {})),
             'line_count': len(current_data.get('lines', []))
         })
 
         # Trim history to window size
         window = int(self.state.thresholds.get('historical_window', 10))
         if len(self.state.history) > window:
-            self.state.history = self.state.history[-window:]
+            del self.state.history[:-window]
 
         lines = current_data.get('lines', [])
         summary = current_data.get('summary', {})
@@ -634,6 +660,42 @@ class GridMonitorAgent:
 
         Updates AgentState patterns and thresholds based on outcomes
         """
+        result = self._apply_feedback(action_id, operator_feedback)
+        self._trim_action_history()
+
+        self._log_decision('feedback_received', {
+            'action_id': action_id,
+            'result': result,
+            'updated_thresholds': self.state.thresholds
+        })
+
+    def learn_from_outcomes_batch(
+        self,
+        feedbacks: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Learn from several operator feedback entries at once
+
+        Applies each entry exactly as learn_from_outcomes would, in order,
+        but trims the action history and writes the decision log once.
+
+        Args:
+            feedbacks: List of (action_id, operator_feedback) tuples
+        """
+        results = [
+            self._apply_feedback(action_id, operator_feedback)
+            for action_id, operator_feedback in feedbacks
+        ]
+        self._trim_action_history()
+
+        self._log_decision('feedback_batch_received', {
+            'action_ids': [action_id for action_id, _ in feedbacks],
+            'results': results,
+            'updated_thresholds': self.state.thresholds
+        })
+
+    def _apply_feedback(self, action_id: str, operator_feedback: Dict[str, Any]) -> str:
+        """Record one feedback entry and adjust thresholds; returns the result"""
         feedback_entry = {
             'action_id': action_id,
             'timestamp': datetime.utcnow().isoformat(),
@@ -642,10 +704,6 @@ class GridMonitorAgent:
 
         self.state.action_history.append(feedback_entry)
 
-        # Keep action history bounded
-        if len(self.state.action_history) > 100:
-            self.state.action_history = self.state.action_history[-100:]
-
         result = operator_feedback.get('result', 'unknown')
 
         # Adjust thresholds based on feedback
@@ -669,11 +727,12 @@ class GridMonitorAgent:
             )
             self.logger.info(f"Action {action_id} rejected, raising high_loading threshold to {self.state.thresholds['high_loading']}")
 
-        self._log_decision('feedback_received', {
-            'action_id': action_id,
-            'result': result,
-            'updated_thresholds': self.state.thresholds
-        })
+        return result
+
+    def _trim_action_history(self) -> None:
+        """Keep action history bounded"""
+        if len(self.state.action_history) > 100:
+            del self.state.action_history[:-100]
 
     def heartbeat_loop(self) -> Dict[str, Any]:
         """
@@ -1,20 +1,24 @@
 """
 Flask API server for Grid Real-Time Rating Analysis System
 """
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
+import gzip
+import hashlib
 import json
 import logging
 import os
+import threading
+import orjson
 
 # Configure logging
 # Default to DEBUG to assist interactive troubleshooting during development
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-from rating_calculator import RatingCalculator
+from rating_calculator import RatingCalculator, THRESHOLD_MODES
 from data_loader import DataLoader
 from map_generator import GridMapGenerator
 from chatbot_service import GridChatbotService
@@ -61,6 +65,37 @@ def clean_nan_values(obj):
     else:
         return obj
 
+def orjson_response(payload, status=200):
+    """
+    Serialize a large payload with orjson in a single C-level pass.
+
+    orjson encodes numpy scalars/arrays natively and writes NaN/inf as null,
+    so callers can skip the recursive clean_nan_values() walk.
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return Response(body, status=status, mimetype='application/json')
+
+def compressed_json_response(payload, status=200):
+    """
+    Serialize a payload carrying map HTML, gzip it when the client accepts it,
+    and tag it with an ETag so an unchanged map is answered with 304.
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    etag = hashlib.md5(body).hexdigest()
+
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    response = Response(body, status=status, mimetype='application/json')
+    if 'gzip' in request.accept_encodings:
+        response.set_data(gzip.compress(body, compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.set_etag(etag)
+    return response
+
 app = Flask(__name__)
 app.json_encoder = NanSafeJSONEncoder
 CORS(app)
@@ -70,6 +105,19 @@ data_loader = DataLoader()
 calculator = RatingCalculator(data_loader)
 map_generator = GridMapGenerator(data_loader)
 
+# Load scaling analyzer is created on first use and shared across requests;
+# its PyPSA network is mutated by each solve, so access is serialized
+_load_scaling_analyzer = None
+_load_scaling_lock = threading.Lock()
+
+def get_load_scaling_analyzer():
+    """Return the shared LoadScalingAnalyzer, loading its network on first call"""
+    global _load_scaling_analyzer
+    if _load_scaling_analyzer is None:
+        from load_scaling_analyzer import LoadScalingAnalyzer
+        _load_scaling_analyzer = LoadScalingAnalyzer()
+    return _load_scaling_analyzer
+
 def load_required_data():
     """
     Load required data files and verify they are accessible
@@ -201,14 +249,14 @@ def calculate_ratings():
         # Calculate ratings for all lines
         results = calculator.calculate_all_line_ratings(weather_params)
 
-        # Clean NaN values before sending to frontend
+        # orjson writes NaN as null and encodes numpy values natively
         response_data = {
             "weather": weather_params,
-            "lines": clean_nan_values(results['lines']),
-            "summary": clean_nan_values(results['summary'])
+            "lines": results['lines'],
+            "summary": results['summary']
         }
 
-        return jsonify(response_data)
+        return orjson_response(response_data)
 
     except Exception as e:
         import traceback
@@ -223,7 +271,8 @@ def find_threshold():
     {
         "temp_range": [20, 50],   # Temperature range to search
         "wind_speed": 2.0,
-        "step": 1                 # Temperature increment
+        "step": 1,                # Temperature increment
+        "mode": "sweep"           # "bisect" only locates the first overload temperature
     }
     """
     try:
@@ -231,12 +280,17 @@ def find_threshold():
         temp_range = params.get('temp_range', [20, 50])
         wind_speed = params.get('wind_speed', 2.0)
         step = params.get('step', 1)
+        mode = params.get('mode', 'sweep')
+        if mode not in THRESHOLD_MODES:
+            return jsonify({
+                "error": f"Invalid mode '{mode}', expected one of: {', '.join(THRESHOLD_MODES)}"
+            }), 400
 
         results = calculator.find_overload_threshold(
-            temp_range[0], temp_range[1], wind_speed, step
+            temp_range[0], temp_range[1], wind_speed, step, mode=mode
         )
 
-        return jsonify(results)
+        return orjson_response(results)
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -763,7 +817,7 @@ def generate_map():
             "weather": weather_params
         }
 
-        return jsonify(response_data)
+        return compressed_json_response(response_data)
 
     except Exception as e:
         import traceback
@@ -870,7 +924,7 @@ def generate_outage_map():
             }
 
             logger.info(f"Successfully generated outage map for {len(outage_result.get('outage_lines', []))} lines")
-            return jsonify(response)
+            return compressed_json_response(response)
 
         except Exception as e:
             logger.error(f"Failed to generate outage map: {str(e)}")
@@ -902,8 +956,6 @@ def analyze_daily_load_scaling():
         JSON with hourly analysis results and summary
     """
     try:
-        from load_scaling_analyzer import LoadScalingAnalyzer
-
         hours = request.args.get('hours', 24, type=int)
 
         if hours < 1 or hours > 48:
@@ -914,18 +966,14 @@ def analyze_daily_load_scaling():
 
         logger.info(f"Analyzing daily load scaling for {hours} hours...")
 
-        # Initialize analyzer
-        analyzer = LoadScalingAnalyzer()
+        # Run daily analysis on the shared analyzer
+        with _load_scaling_lock:
+            result = get_load_scaling_analyzer().analyze_daily_profile(hours)
 
-        # Run daily analysis
-        result = analyzer.analyze_daily_profile(hours)
+        logger.info(f"Daily load scaling analysis complete: {result['summary']['hours_converged']}/{hours} hours converged")
 
-        # Clean NaN values
-        result_clean = clean_nan_values(result)
-
-        logger.info(f"Daily load scaling analysis complete: {result_clean['summary']['hours_converged']}/{hours} hours converged")
-
-        return jsonify(result_clean)
+        # orjson handles numpy types and NaN, so no clean_nan_values() pass is needed
+        return orjson_response(result)
 
     except Exception as e:
         import traceback
@@ -948,8 +996,6 @@ def analyze_single_hour_loading(hour):
         JSON with analysis results for the specified hour
     """
     try:
-        from load_scaling_analyzer import LoadScalingAnalyzer
-
         if hour < 0 or hour >= 24:
             return jsonify({
                 "success": False,
@@ -958,11 +1004,9 @@ def analyze_single_hour_loading(hour):
 
         logger.info(f"Analyzing load scaling for hour {hour}...")
 
-        # Initialize analyzer
-        analyzer = LoadScalingAnalyzer()
-
-        # Analyze single hour
-        result = analyzer.analyze_single_hour(hour)
+        # Analyze single hour (memoized per hour on the shared analyzer)
+        with _load_scaling_lock:
+            result = get_load_scaling_analyzer().analyze_single_hour(hour)
 
         # Clean NaN values
         result_clean = clean_nan_values(result)
@@ -990,8 +1034,6 @@ def get_load_profile():
         JSON with load profile data points
     """
     try:
-        from load_scaling_analyzer import LoadScalingAnalyzer
-
         hours = request.args.get('hours', 24, type=int)
 
         if hours < 1 or hours > 48:
@@ -1000,11 +1042,9 @@ def get_load_profile():
                 "error": "Hours must be between 1 and 48"
             }), 400
 
-        # Initialize analyzer
-        analyzer = LoadScalingAnalyzer()
-
         # Get profile
-        profile = analyzer.get_load_profile(hours)
+        with _load_scaling_lock:
+            profile = get_load_scaling_analyzer().get_load_profile(hours)
 
         return jsonify({
             "success": True,
@@ -0,0 +1,30 @@
+"""
+Shared pytest fixtures for the backend tests
+"""
+import pytest
+
+
+@pytest.fixture(scope="session")
+def data_loader():
+    """Grid data loader shared by the session"""
+    from data_loader import DataLoader
+    return DataLoader()
+
+
+@pytest.fixture(scope="session")
+def calculator(data_loader):
+    """IEEE 738 rating calculator shared by the session"""
+    from rating_calculator import RatingCalculator
+    return RatingCalculator(data_loader)
+
+
+@pytest.fixture(scope="session")
+def agent(calculator):
+    """Autonomous agent service, skipped when the Anthropic client is unavailable"""
+    from agent_service import GridMonitorAgent
+    try:
+        return GridMonitorAgent(rating_calculator=calculator)
+    except Exception as e:
+        # Missing ANTHROPIC_API_KEY raises ValueError; a client that cannot be
+        # constructed should skip the agent tests rather than error them
+        pytest.skip(f"Agent initialization skipped: {e}")
@@ -0,0 +1,116 @@
+"""
+Compiled geometry kernels for map generation
+
+Numba is an optional dependency. When it is installed the kernels below are
+JIT-compiled (and cached on disk); otherwise ``NUMBA_AVAILABLE`` is False and
+callers fall back to their NumPy implementations.
+"""
+import math
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def _line_midpoint(lons, lats):
+    """
+    Distance-weighted midpoint of a line string.
+
+    Args:
+        lons: 1-D float64 array of longitudes (degrees)
+        lats: 1-D float64 array of latitudes (degrees)
+
+    Returns:
+        tuple: (mid_lon, mid_lat), both NaN if the midpoint cannot be located
+    """
+    n = lons.shape[0]
+    segment_distances = np.empty(n - 1)
+    total_distance = 0.0
+
+    # Haversine distance of every segment
+    for i in range(n - 1):
+        lat1 = math.radians(lats[i])
+        lat2 = math.radians(lats[i + 1])
+        dlat = lat2 - lat1
+        dlon = math.radians(lons[i + 1] - lons[i])
+        a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+        distance = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+        segment_distances[i] = distance
+        total_distance += distance
+
+    # Walk the segments until half the total distance is covered
+    target_distance = total_distance / 2
+    accumulated = 0.0
+    for i in range(n - 1):
+        segment_dist = segment_distances[i]
+        if accumulated + segment_dist >= target_distance:
+            if segment_dist == 0:
+                break
+            frac = (target_distance - accumulated) / segment_dist
+            return (lons[i] + (lons[i + 1] - lons[i]) * frac,
+                    lats[i] + (lats[i + 1] - lats[i]) * frac)
+        accumulated += segment_dist
+
+    return (np.nan, np.nan)
+
+
+def simplify_line(pts, tolerance):
+    """
+    Douglas-Peucker simplification of a line string.
+
+    Distances are planar in coordinate units, which is adequate for the
+    small tolerances used to drop visually redundant vertices.
+
+    Args:
+        pts: (N, 2) float array of (lon, lat) vertices
+        tolerance: Maximum allowed deviation from the simplified line (degrees)
+
+    Returns:
+        np.ndarray: Retained vertices, always including both endpoints
+    """
+    n = pts.shape[0]
+    if n < 3:
+        return pts
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+
+        # Perpendicular distance of interior vertices from the chord start->end
+        chord = pts[end] - pts[start]
+        rel = pts[start + 1:end] - pts[start]
+        chord_len = math.hypot(chord[0], chord[1])
+        if chord_len == 0:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        else:
+            dist = np.abs(chord[0] * rel[:, 1] - chord[1] * rel[:, 0]) / chord_len
+
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+
+    return pts[keep]
+
+
+if NUMBA_AVAILABLE:
+    line_midpoint = njit(cache=True, fastmath=True)(_line_midpoint)
+else:
+    line_midpoint = None
+    logger.debug("numba not installed; using NumPy midpoint calculation")
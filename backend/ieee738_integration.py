@@ -21,11 +21,13 @@ import math
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from config import DataConfig, AppConfig
 from csv_data_loader import get_loader
 import ieee738
+from rating_kernels import steady_state_thermal_ratings
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +61,16 @@ class IEEE738RatingEngine:
         self._cond_df = df
         return df
 
+    def get_conductor_library(self) -> pd.DataFrame:
+        """Return the conductor library, loading it on first use.
+
+        Returns:
+            pd.DataFrame: conductor_library.csv with stripped ConductorName
+        """
+        if self._cond_df is None:
+            self._load_conductor_library()
+        return self._cond_df
+
     def _get_conductor_row(self, conductor_name: str) -> Optional[pd.Series]:
         if self._cond_df is None:
             self._load_conductor_library()
@@ -150,6 +162,71 @@ class IEEE738RatingEngine:
 
         return row_result
 
+    def _compute_line_ratings_batch(self, lines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Compute IEEE-738 ratings for many lines with one vectorized heat balance.
+
+        Lines the batch cannot rate (missing conductor or MOT, rejected
+        inputs) go through compute_line_rating so their error is reported
+        exactly as for a single line.
+
+        Args:
+            lines: line dictionaries, as accepted by compute_line_rating
+
+        Returns:
+            list: result rows in the order of ``lines``
+        """
+        n = len(lines)
+        amps = np.full(n, np.nan)
+        mot_vals = np.full(n, np.nan)
+
+        try:
+            library = self.get_conductor_library().drop_duplicates("ConductorName").set_index("ConductorName")
+        except Exception as e:
+            logger.warning(f"Conductor library unavailable for batch rating: {e}")
+            library = None
+
+        if n and library is not None:
+            conductors = pd.Series([ld.get("conductor") for ld in lines], dtype=object)
+            raw_mot = pd.Series([ld.get("MOT") for ld in lines], dtype=object)
+            mot = pd.to_numeric(raw_mot, errors="coerce").to_numpy(dtype=float)
+
+            # Missing MOT falls back to ambient Ta; unparseable MOT is left to compute_line_rating
+            missing_mot = raw_mot.isna().to_numpy()
+            ta_default = float(self.ambient_defaults.get("Ta", 75.0))
+            for i in np.flatnonzero(missing_mot):
+                logger.warning(f"Line {lines[i].get('name')}: MOT missing, using ambient Ta default: {self.ambient_defaults.get('Ta')}")
+            mot = np.where(missing_mot, ta_default, mot)
+            for i in np.flatnonzero((mot < 50.0) | (mot > 100.0)):
+                logger.warning(f"Line {lines[i].get('name')}: MOT {mot[i]} outside expected range (50-100). Clamping.")
+            mot_vals = np.clip(mot, 50.0, 100.0)
+
+            try:
+                amps = steady_state_thermal_ratings(
+                    self.ambient_defaults,
+                    conductors.map(library["CDRAD_in"]).to_numpy(dtype=float) * 2.0,
+                    conductors.map(library["RES_25C"]).to_numpy(dtype=float) / 5280.0,
+                    conductors.map(library["RES_50C"]).to_numpy(dtype=float) / 5280.0,
+                    mot_vals,
+                )
+            except Exception as e:
+                logger.warning(f"Batch IEEE-738 rating failed, rating lines individually: {e}")
+
+        results: List[Dict[str, Any]] = []
+        for line_dict, rating_amps, mot_val in zip(lines, amps.tolist(), mot_vals.tolist()):
+            if math.isnan(rating_amps):
+                results.append(self.compute_line_rating(line_dict))
+                continue
+            results.append({
+                "line_name": line_dict.get("name"),
+                "conductor_type": line_dict.get("conductor"),
+                "mot_celsius": mot_val,
+                "rating_amps": rating_amps,
+                "rating_69kv_mva": (math.sqrt(3) * rating_amps * 69000.0) / 1e6,
+                "rating_138kv_mva": (math.sqrt(3) * rating_amps * 138000.0) / 1e6,
+                "error": None,
+            })
+        return results
+
     def compute_all_line_ratings(self, output_csv: Optional[Path] = None) -> pd.DataFrame:
         """Compute ratings for all lines and optionally write CSV.
 
@@ -157,14 +234,12 @@ class IEEE738RatingEngine:
             pd.DataFrame with columns: line_name, conductor_type, mot_celsius,
             rating_amps, rating_69kv_mva, rating_138kv_mva, error
         """
-        lines = self.loader.get_all_lines(validate=False)
-        results: List[Dict[str, Any]] = []
-
-        for line in lines:
+        lines = [
             # support either pydantic model or dict
-            line_dict = line if isinstance(line, dict) else line.__dict__
-            row_result = self.compute_line_rating(line_dict)
-            results.append(row_result)
+            line if isinstance(line, dict) else line.__dict__
+            for line in self.loader.get_all_lines(validate=False)
+        ]
+        results = self._compute_line_ratings_batch(lines)
 
         df_out = pd.DataFrame(results)
 
@@ -10,12 +10,19 @@ Assumptions:
 - Generation scales proportionally with load to maintain power balance
 """
 
+import os
 import pypsa
 import numpy as np
 import logging
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from config import DataConfig
+from loading_kernels import (
+    LINE_STATUS_NAMES, STATUS_CAUTION, STATUS_HIGH_STRESS, STATUS_OVERLOADED,
+    compute_line_stats
+)
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +55,21 @@ def convert_numpy_types(obj):
         return obj
 
 
+# Per-process analyzer used by the daily-profile worker pool
+_worker_analyzer = None
+
+
+def _init_worker():
+    """Load the PyPSA network once per worker process."""
+    global _worker_analyzer
+    _worker_analyzer = LoadScalingAnalyzer()
+
+
+def _analyze_hour_worker(hour: int, scale_factor: float) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+    """Analyze a single hour on the worker's own network copy."""
+    return _worker_analyzer._solve_hour(hour, scale_factor)
+
+
 class LoadScalingAnalyzer:
     """
     Analyzes transmission system stress under varying load/generation conditions
@@ -59,6 +81,13 @@ class LoadScalingAnalyzer:
         self.network = None
         self.baseline_load = None
         self.baseline_gen = None
+        self._baseline_load_values = None
+        self._baseline_gen_values = None
+        self._baseline_load_total = 0.0
+        self._baseline_gen_total = 0.0
+        self._pf_warm_start = False
+        # Single-hour results keyed by (hour, rounded scale factor)
+        self._hour_cache: Dict[tuple, Dict[str, Any]] = {}
         self._load_network()
 
     def _load_network(self):
@@ -81,23 +110,36 @@ class LoadScalingAnalyzer:
             # Store baseline values
             self.baseline_load = self.network.loads['p_set'].copy()
             self.baseline_gen = self.network.generators['p_set'].copy()
+            self._baseline_load_values = self.baseline_load.to_numpy(dtype=float)
+            self._baseline_gen_values = self.baseline_gen.to_numpy(dtype=float)
+            self._baseline_load_total = float(self.baseline_load.sum())
+            self._baseline_gen_total = float(self.baseline_gen.sum())
 
-            logger.info(f"Baseline total load: {self.baseline_load.sum():.2f} MW")
-            logger.info(f"Baseline total gen: {self.baseline_gen.sum():.2f} MW")
+            # Reactive power set to 0 in base case (scaling keeps it at 0)
+            self.network.loads['q_set'] = 0.0
+            self.network.generators['q_set'] = 0.0
+
+            logger.info(f"Baseline total load: {self._baseline_load_total:.2f} MW")
+            logger.info(f"Baseline total gen: {self._baseline_gen_total:.2f} MW")
 
         except Exception as e:
             logger.error(f"Error loading PyPSA network: {e}")
             raise RuntimeError(f"Failed to load PyPSA network: {e}")
 
-    def _generate_daily_profile(self, hours: int = 24) -> List[float]:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _generate_daily_profile(hours: int = 24) -> np.ndarray:
         """
         Generate daily load profile using sine wave.
 
+        The profile only depends on ``hours``, so results are memoized and
+        returned as read-only arrays shared between calls.
+
         Args:
             hours: Number of hours in the profile (default 24)
 
         Returns:
-            List of scaling factors (0.9 to 1.1)
+            np.ndarray of scaling factors (0.9 to 1.1)
         """
         # Generate time points
         x = np.arange(hours)
@@ -110,8 +152,9 @@ class LoadScalingAnalyzer:
 
         # Generate profile
         profile = A * np.sin(2 * np.pi * f * x + C) + offset
+        profile.flags.writeable = False
 
-        return profile.tolist()
+        return profile
 
     def _run_power_flow(self) -> Dict[str, Any]:
         """
@@ -121,10 +164,17 @@ class LoadScalingAnalyzer:
             dict: Power flow convergence info
         """
         try:
-            info = self.network.pf()
+            # Topology and admittance matrix never change between hours, so after
+            # the first solve skip PyPSA's preparation step and seed Newton-Raphson
+            # with the previous solution instead of a flat start
+            warm = self._pf_warm_start
+            info = self.network.pf(skip_pre=warm, use_seed=warm)
             converged = bool(info.converged.any().any())
             max_error = float(info.error.max().max())
 
+            # Only seed from converged solutions
+            self._pf_warm_start = converged
+
             logger.debug(f"Power flow converged: {converged}, max error: {max_error:.2e}")
 
             return {
@@ -142,17 +192,9 @@ class LoadScalingAnalyzer:
         Args:
             scale_factor: Multiplier for load/gen (e.g., 1.1 = 110% of nominal)
         """
-        # Reset to baseline
-        self.network.loads['p_set'] = self.baseline_load.copy()
-        self.network.loads['q_set'] = 0.0  # Reactive power set to 0 in base case
-        self.network.generators['p_set'] = self.baseline_gen.copy()
-        self.network.generators['q_set'] = 0.0
-
-        # Apply scaling
-        self.network.loads['p_set'] = scale_factor * self.network.loads['p_set']
-        self.network.loads['q_set'] = scale_factor * self.network.loads['q_set']
-        self.network.generators['p_set'] = scale_factor * self.network.generators['p_set']
-        self.network.generators['q_set'] = scale_factor * self.network.generators['q_set']
+        # Scale from the cached baseline arrays; q_set stays at 0 (set at load time)
+        self.network.loads['p_set'] = self._baseline_load_values * scale_factor
+        self.network.generators['p_set'] = self._baseline_gen_values * scale_factor
 
     def _analyze_hour(self, hour: int, scale_factor: float) -> Dict[str, Any]:
         """
@@ -165,6 +207,20 @@ class LoadScalingAnalyzer:
         Returns:
             dict: Analysis results for this hour
         """
+        return self._solve_hour(hour, scale_factor)[0]
+
+    def _solve_hour(self, hour: int, scale_factor: float) -> Tuple[Dict[str, Any], Optional[np.ndarray]]:
+        """
+        Analyze one hour and also return the raw per-line loading array.
+
+        Args:
+            hour: Hour of day (0-23)
+            scale_factor: Load/gen scaling factor
+
+        Returns:
+            tuple: (hour result dict, loading_pct array in network line order,
+                or None if the power flow did not converge)
+        """
         # Scale network
         self._scale_network(scale_factor)
 
@@ -178,40 +234,35 @@ class LoadScalingAnalyzer:
                 'scale_factor': scale_factor,
                 'converged': False,
                 'error': 'Power flow did not converge'
-            }
+            }, None
+
+        # Get line flows and calculate loading (vectorized over all lines)
+        lines = self.network.lines
+        flows = self.network.lines_t['p0'].iloc[0].reindex(lines.index)
+
+        flow_mw = np.abs(flows.to_numpy(dtype=float))
+        s_nom = lines['s_nom'].to_numpy(dtype=float)
+
+        # MVA flow (power factor 0.95), loading and integer status codes in one
+        # pass; codes are mapped to strings only for output
+        flow_mva, loading_pct, status_codes, status_counts = compute_line_stats(flow_mw, s_nom)
 
-        # Get line flows and calculate loading
-        flows = self.network.lines_t['p0'].loc['now', :]
-        line_data = []
-
-        for line_name, line in self.network.lines.iterrows():
-            flow_mw = abs(flows[line_name])
-            s_nom = line['s_nom']
-
-            # Convert MW to MVA (approximate with power factor 0.95)
-            flow_mva = flow_mw / 0.95 if flow_mw != 0 else 0
-            loading_pct = (flow_mva / s_nom * 100) if s_nom > 0 else 0
-
-            # Determine status
-            if loading_pct >= 100:
-                status = 'overloaded'
-            elif loading_pct >= 90:
-                status = 'high_stress'
-            elif loading_pct >= 60:
-                status = 'caution'
-            else:
-                status = 'normal'
-
-            line_data.append({
-                'name': line_name,
-                'flow_mw': float(flow_mw),
-                'flow_mva': float(flow_mva),
-                'loading_pct': float(loading_pct),
-                'status': status
-            })
-
-        # Calculate statistics
-        loadings = [ld['loading_pct'] for ld in line_data]
+        line_data = [
+            {
+                'name': name,
+                'flow_mw': mw,
+                'flow_mva': mva,
+                'loading_pct': pct,
+                'status': LINE_STATUS_NAMES[code]
+            }
+            for name, mw, mva, pct, code in zip(
+                lines.index.tolist(),
+                flow_mw.tolist(),
+                flow_mva.tolist(),
+                loading_pct.tolist(),
+                status_codes.tolist()
+            )
+        ]
 
         total_load_solved = float(self.network.loads_t['p'].sum(axis=1).iloc[0])
         total_gen_solved = float(self.network.generators_t['p'].sum(axis=1).iloc[0])
@@ -224,46 +275,147 @@ class LoadScalingAnalyzer:
             'total_gen_mw': float(self.network.generators['p_set'].sum()),
             'total_load_solved_mw': total_load_solved,
             'total_gen_solved_mw': total_gen_solved,
-            'max_loading_pct': float(max(loadings)),
-            'avg_loading_pct': float(np.mean(loadings)),
-            'overloaded_count': sum(1 for ld in line_data if ld['status'] == 'overloaded'),
-            'high_stress_count': sum(1 for ld in line_data if ld['status'] == 'high_stress'),
-            'caution_count': sum(1 for ld in line_data if ld['status'] == 'caution'),
+            'max_loading_pct': float(loading_pct.max()),
+            'avg_loading_pct': float(loading_pct.mean()),
+            'overloaded_count': int(status_counts[STATUS_OVERLOADED]),
+            'high_stress_count': int(status_counts[STATUS_HIGH_STRESS]),
+            'caution_count': int(status_counts[STATUS_CAUTION]),
             'lines': line_data,
             'power_flow_info': pf_info
-        }
+        }, loading_pct
+
+    @staticmethod
+    def _hours_by_scale(scales: List[float]) -> List[tuple]:
+        """
+        Order (hour, scale) pairs by scale factor.
 
-    def analyze_daily_profile(self, hours: int = 24) -> Dict[str, Any]:
+        Consecutive solves then differ by a small load step, so each warm-started
+        power flow begins close to its solution.
+        """
+        return sorted(enumerate(scales), key=lambda hour_scale: hour_scale[1])
+
+    def _analyze_hours_parallel(self, scales: List[float], max_workers: int) -> List[tuple]:
+        """
+        Analyze hours in a process pool; each worker loads its own network once.
+
+        Args:
+            scales: Scale factor for each hour
+            max_workers: Number of worker processes
+
+        Returns:
+            list: (hour result, loading_pct) pairs ordered by hour
+        """
+        solved = []
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+            futures = [
+                pool.submit(_analyze_hour_worker, hour, scale)
+                for hour, scale in self._hours_by_scale(scales)
+            ]
+            for future in as_completed(futures):
+                solved.append(future.result())
+
+        solved.sort(key=lambda r: r[0]['hour'])
+        return solved
+
+    def _most_stressed_lines(self, solved: List[tuple], top_n: int = 10) -> List[Dict[str, Any]]:
+        """
+        Find the lines with the highest loading over the day.
+
+        Keeps a running per-line maximum over the hourly loading arrays instead
+        of walking every hour's line dicts.
+
+        Args:
+            solved: (hour result, loading_pct) pairs ordered by hour
+            top_n: Number of lines to return
+
+        Returns:
+            list: Most stressed lines, highest peak loading first
+        """
+        n_lines = len(self.network.lines)
+        running_max = np.full(n_lines, -np.inf)
+        running_hour = np.zeros(n_lines, dtype=np.int32)
+        running_scale = np.zeros(n_lines)
+
+        for result, loading_pct in solved:
+            if loading_pct is None:
+                continue
+            # Strict comparison keeps the earliest hour on ties
+            mask = loading_pct > running_max
+            running_max[mask] = loading_pct[mask]
+            running_hour[mask] = result['hour']
+            running_scale[mask] = result['scale_factor']
+
+        # Stable sort keeps network line order between equal peaks
+        order = np.argsort(-running_max, kind='stable')
+        top = order[np.isfinite(running_max[order])][:top_n]
+
+        names = self.network.lines.index
+        return [
+            {
+                'name': names[i],
+                'max_loading_pct': float(running_max[i]),
+                'hour_of_max': int(running_hour[i]),
+                'scale_at_max': float(running_scale[i])
+            }
+            for i in top.tolist()
+        ]
+
+    def analyze_daily_profile(self, hours: int = 24, max_workers: int = 1) -> Dict[str, Any]:
         """
         Analyze network stress throughout a full day.
 
+        Hours are independent power flow solves. Offline or batch callers can
+        spread them over a process pool with max_workers > 1; the default runs
+        serially, since each pool worker reloads the network and forking from
+        the threaded Flask server is unsafe.
+
         Args:
             hours: Number of hours to analyze (default 24)
+            max_workers: Worker processes to use (default 1, serial in this
+                process); None uses min(hours, CPU count)
 
         Returns:
             dict: Complete daily analysis results
         """
         logger.info(f"Analyzing daily load profile ({hours} hours)...")
 
+        # Re-solving every hour moves the network state, so drop memoized
+        # single-hour results to keep them consistent with this run
+        self._hour_cache.clear()
+
         # Generate load profile
-        profile = self._generate_daily_profile(hours)
+        scales = self._generate_daily_profile(hours).tolist()
+
+        if max_workers is None:
+            max_workers = min(hours, os.cpu_count() or 1)
 
         # Analyze each hour
-        hourly_results = []
-        for hour, scale in enumerate(profile):
-            logger.debug(f"Analyzing hour {hour} (scale={scale:.3f})")
-            result = self._analyze_hour(hour, scale)
-            hourly_results.append(result)
+        solved = None
+        if max_workers > 1:
+            try:
+                solved = self._analyze_hours_parallel(scales, max_workers)
+            except Exception as e:
+                logger.warning(f"Parallel daily analysis failed, running serially: {e}")
+
+        if solved is None:
+            solved = []
+            for hour, scale in self._hours_by_scale(scales):
+                logger.debug(f"Analyzing hour {hour} (scale={scale:.3f})")
+                solved.append(self._solve_hour(hour, scale))
+            solved.sort(key=lambda r: r[0]['hour'])
+
+        hourly_results = [result for result, _ in solved]
 
         # Find peak stress conditions
         max_loading_hour = max(hourly_results, key=lambda x: x.get('max_loading_pct', 0))
         max_overload_hour = max(hourly_results, key=lambda x: x.get('overloaded_count', 0))
+        hours_converged = sum(1 for r in hourly_results if r.get('converged', False))
 
         # Calculate summary
         summary = {
             'total_hours': hours,
-            'hours_converged': sum(1 for r in hourly_results if r.get('converged', False)),
-            'hours_failed': sum(1 for r in hourly_results if not r.get('converged', False)),
+            'hours_converged': hours_converged,
+            'hours_failed': len(hourly_results) - hours_converged,
             'peak_loading': {
                 'hour': max_loading_hour['hour'],
                 'max_loading_pct': max_loading_hour.get('max_loading_pct', 0),
@@ -276,42 +428,20 @@ class LoadScalingAnalyzer:
                 'max_loading_pct': max_overload_hour.get('max_loading_pct', 0),
                 'scale_factor': max_overload_hour['scale_factor']
             },
-            'load_profile': [{'hour': i, 'scale': s} for i, s in enumerate(profile)]
+            'load_profile': [{'hour': i, 'scale': s} for i, s in enumerate(scales)]
         }
 
         # Find most stressed lines throughout the day
-        line_max_loadings = {}
-        for hour_result in hourly_results:
-            if hour_result.get('converged'):
-                for line in hour_result.get('lines', []):
-                    line_name = line['name']
-                    loading_pct = line['loading_pct']
-                    if line_name not in line_max_loadings or loading_pct > line_max_loadings[line_name]['max_loading_pct']:
-                        line_max_loadings[line_name] = {
-                            'name': line_name,
-                            'max_loading_pct': loading_pct,
-                            'hour_of_max': hour_result['hour'],
-                            'scale_at_max': hour_result['scale_factor']
-                        }
-
-        # Get top 10 most stressed lines
-        top_lines = sorted(
-            line_max_loadings.values(),
-            key=lambda x: x['max_loading_pct'],
-            reverse=True
-        )[:10]
-
-        summary['most_stressed_lines'] = top_lines
-
-        result = {
+        summary['most_stressed_lines'] = self._most_stressed_lines(solved)
+
+        # Hourly results are built from native Python types already, so the
+        # recursive convert_numpy_types() pass is skipped for this large payload
+        return {
             'success': True,
             'summary': summary,
             'hourly_results': hourly_results
         }
 
-        # Convert numpy types to native Python
-        return convert_numpy_types(result)
-
     def analyze_single_hour(self, hour: int) -> Dict[str, Any]:
         """
         Analyze network at a specific hour.
@@ -328,14 +458,22 @@ class LoadScalingAnalyzer:
                 'error': f'Invalid hour: {hour}. Must be 0-23.'
             }
 
-        # Generate profile and get scale for this hour
-        profile = self._generate_daily_profile(24)
-        scale = profile[hour]
+        # Get scale for this hour from the cached profile
+        scale = float(self._generate_daily_profile(24)[hour])
+
+        # The profile is deterministic, so repeated requests for an hour reuse
+        # the first solve. Cached results are shared; callers must not mutate them.
+        key = (hour, round(scale, 4))
+        cached = self._hour_cache.get(key)
+        if cached is not None:
+            return cached
 
         result = self._analyze_hour(hour, scale)
         result['success'] = result.get('converged', False)
 
-        return convert_numpy_types(result)
+        result = convert_numpy_types(result)
+        self._hour_cache[key] = result
+        return result
 
     def get_load_profile(self, hours: int = 24) -> List[Dict[str, float]]:
         """
@@ -348,12 +486,14 @@ class LoadScalingAnalyzer:
             list: Load profile data points
         """
         profile = self._generate_daily_profile(hours)
+        loads = profile * self._baseline_load_total
+        gens = profile * self._baseline_gen_total
         return [
             {
                 'hour': i,
-                'scale_factor': float(s),
-                'load_mw': float(self.baseline_load.sum() * s),
-                'gen_mw': float(self.baseline_gen.sum() * s)
+                'scale_factor': s,
+                'load_mw': load,
+                'gen_mw': gen
             }
-            for i, s in enumerate(profile)
+            for i, (s, load, gen) in enumerate(zip(profile.tolist(), loads.tolist(), gens.tolist()))
         ]
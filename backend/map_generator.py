@@ -3,22 +3,301 @@ Hawaii 40 Network - Interactive Map Generator for Grid Monitor
 Generates real-time network visualization with power flow data integration
 """
 
+import hashlib
 import json
-import math
 import logging
+import numbers
+import threading
+from collections import OrderedDict
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.offline import get_plotlyjs_version
 from typing import Dict, List, Tuple, Optional
 from data_models import DataLoadError
+from geo_kernels import line_midpoint, simplify_line
+from rating_calculator import RatingCalculator
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Serialize figures with orjson when available; plotly's stdlib json encoder
+# dominates figure serialization for large multi-line maps
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    logger.debug("orjson not installed; using plotly's default JSON engine")
+
+# Decimal places kept for plotted coordinates (~1 m, finer than a pixel at zoom 12)
+COORD_DECIMALS = 5
+
+# Douglas-Peucker tolerance for plotted line geometry (degrees, ~10 m)
+SIMPLIFY_TOLERANCE_DEG = 0.0001
+
+# Rendered map HTML pages kept per GridMapGenerator
+MAP_HTML_CACHE_SIZE = 32
+
+# Chatbot line detail lookups kept per GridMapGenerator
+LINE_DETAILS_CACHE_SIZE = 512
+
+# Resolution chatbot weather is rounded to before rating (deg C, ft/s, deg);
+# other numeric weather values are only normalized to float
+LINE_DETAILS_WEATHER_BUCKETS = {'Ta': 0.5, 'WindVelocity': 0.5, 'WindAngleDeg': 1.0}
+
+# Stress levels in drawing order, and their integer codes for bucketing
+STRESS_LEVELS = ('normal', 'caution', 'high', 'critical')
+STRESS_LEVEL_CODES = {level: code for code, level in enumerate(STRESS_LEVELS)}
+
+# Line colors for the live map, and the opaque variants used in hover text
+STRESS_COLORS = {
+    'normal': 'rgba(0, 255, 180, 0.2)',   # neon teal
+    'caution': 'rgba(255, 204, 0, 0.35)', # amber
+    'high': 'rgba(255, 80, 0, 0.45)',     # orange-red
+    'critical': 'rgba(255, 0, 60, 0.5)'   # vivid red
+}
+STRESS_COLORS_SOLID = {level: color.replace('0.85', '1.0') for level, color in STRESS_COLORS.items()}
+
+# Hover template for rated lines; Plotly.js fills it from each point's customdata
+# (one row per line, expanded onto the vertices by the page script)
+# row [name, LineName, loading %, flow, rating, margin, voltage, conductor, connection]
+RATED_HOVER_TEMPLATE = (
+    "<b style='font-size: 15px'>%{{customdata[1]}}</b><br>"
+    "<br>"
+    "<b style='color: {color}; font-size: 15px'>⚡ Loading: %{{customdata[2]:.1f}}%</b><br>"
+    "<br>"
+    "<b>Power Flow:</b><br>"
+    "  • Flow: %{{customdata[3]:.1f}} MVA<br>"
+    "  • Rating: %{{customdata[4]:.1f}} MVA<br>"
+    "  • Margin: %{{customdata[5]:.1f}} MVA<br>"
+    "<br>"
+    "<b>Line Details:</b><br>"
+    "  • Voltage: %{{customdata[6]}} kV<br>"
+    "  • Conductor: %{{customdata[7]}}<br>"
+    "<br>"
+    "%{{customdata[8]}}"
+    "<extra></extra>"
+)
+
+# Static page pieces for the map HTML. Figures are serialized with
+# fig.to_json() and dropped into the template, instead of rendering with
+# fig.to_html() and patching the result with str.replace().
+# Both maps only use Scattermapbox, so load Plotly's mapbox partial bundle
+# (same version as the bundled plotly.js) instead of the full library
+PLOTLY_CDN_URL = f"https://cdn.plot.ly/plotly-mapbox-{get_plotlyjs_version()}.min.js"
+
+# Plotly config for both maps (drag-to-pan is already the mapbox default)
+MAP_CONFIG_JSON = json.dumps({'scrollZoom': True, 'displayModeBar': False, 'responsive': True})
+
+MAP_CSS = """
+    html, body {
+        margin: 0 !important;
+        padding: 0 !important;
+        width: 100% !important;
+        height: 100% !important;
+        overflow: hidden !important;
+    }
+    .plotly-graph-div {
+        width: 100% !important;
+        height: 100vh !important;
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+    #grid-map {
+        width: 100% !important;
+        height: 100vh !important;
+        margin: 0 !important;
+        padding: 0 !important;
+    }
+"""
+
+ZOOM_CONTROLS_CSS = """
+    /* Custom zoom controls */
+    .custom-zoom-controls {
+        position: fixed;
+        top: 20px;
+        left: 20px;
+        z-index: 1000;
+        display: flex;
+        flex-direction: column;
+        gap: 8px;
+        background: rgba(20, 20, 22, 0.9);
+        backdrop-filter: blur(10px);
+        border-radius: 8px;
+        padding: 8px;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.4);
+    }
+
+    .zoom-btn {
+        width: 36px;
+        height: 36px;
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 6px;
+        color: #ffffff;
+        font-size: 20px;
+        font-weight: 600;
+        cursor: pointer;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        transition: all 0.2s;
+    }
+
+    .zoom-btn:hover {
+        background: rgba(255, 255, 255, 0.2);
+        transform: scale(1.05);
+    }
+
+    .zoom-btn:active {
+        transform: scale(0.95);
+    }
+"""
+
+ZOOM_CONTROLS_HTML = """
+<div class="custom-zoom-controls">
+    <button class="zoom-btn" onclick="zoomIn()">+</button>
+    <button class="zoom-btn" onclick="zoomOut()">−</button>
+</div>
+
+<script>
+    function zoomIn() {
+        const plotDiv = document.getElementById('grid-map');
+        if (plotDiv && plotDiv.layout && plotDiv.layout.mapbox) {
+            const currentZoom = plotDiv.layout.mapbox.zoom || 12;
+            Plotly.relayout(plotDiv, {'mapbox.zoom': currentZoom + 0.5});
+        }
+    }
+
+    function zoomOut() {
+        const plotDiv = document.getElementById('grid-map');
+        if (plotDiv && plotDiv.layout && plotDiv.layout.mapbox) {
+            const currentZoom = plotDiv.layout.mapbox.zoom || 12;
+            Plotly.relayout(plotDiv, {'mapbox.zoom': Math.max(1, currentZoom - 0.5)});
+        }
+    }
+
+    // Enable scroll zoom on the map
+    document.addEventListener('DOMContentLoaded', function() {
+        const plotDiv = document.getElementById('grid-map');
+        if (plotDiv) {
+            plotDiv.on('plotly_relayout', function(eventData) {
+                // Allow zoom interactions
+            });
+        }
+    });
+</script>
+"""
+
+MAP_PAGE_HEAD = """<html>
+<head><meta charset="utf-8" />
+<style>"""
+
+MAP_PAGE_BODY = """</style>
+</head>
+<body>
+    <div>
+        <script type="text/javascript">window.PlotlyConfig = {MathJaxConfig: 'local'};</script>
+        <script charset="utf-8" src="%s"></script>
+        <div id="grid-map" class="plotly-graph-div" style="height:100%%; width:100%%;"></div>
+        <script type="text/javascript">
+            window.PLOTLYENV = window.PLOTLYENV || {};
+            if (document.getElementById("grid-map")) {
+                const figure = """ % PLOTLY_CDN_URL
+
+MAP_PAGE_PLOT = """;
+                // Traces send each line's hover data once in meta.lookup; expand
+                // it onto every vertex through the line index in customdata
+                figure.data.forEach(function (trace) {
+                    const lookup = trace.meta && trace.meta.lookup;
+                    if (!lookup) {
+                        return;
+                    }
+                    const index = trace.customdata;
+                    Object.keys(lookup).forEach(function (key) {
+                        trace[key] = index.map(function (i) {
+                            return i === null ? null : lookup[key][i];
+                        });
+                    });
+                });
+                Plotly.newPlot("grid-map", figure.data, figure.layout, %s);
+            };
+        </script>
+    </div>
+""" % MAP_CONFIG_JSON
+
+MAP_PAGE_TAIL = """</body>
+</html>
+"""
+
+
+def join_with_gaps(arrays: List[np.ndarray]) -> np.ndarray:
+    """
+    Concatenate per-line coordinate arrays into one trace array.
+
+    A NaN (serialized as null) follows every line so Plotly breaks the
+    trace between lines.
+    """
+    gap = np.full(1, np.nan, dtype=np.float32)
+    return np.concatenate([part for arr in arrays for part in (arr, gap)])
+
+
+def line_index_customdata(point_counts: List[int]) -> List[Optional[int]]:
+    """
+    Per-vertex line index for a trace built with join_with_gaps.
+
+    Each line's hover data is stored once in the trace's meta.lookup; the page
+    script replaces these indices with the looked-up values before plotting,
+    so hover strings are not repeated for every vertex.
+
+    Args:
+        point_counts: Number of vertices of each line, in trace order
+
+    Returns:
+        list: Index of the line for every vertex, None at each gap
+    """
+    customdata = []
+    for i, n in enumerate(point_counts):
+        customdata.extend([i] * n)
+        customdata.append(None)
+    return customdata
+
+
+def render_map_page(fig: go.Figure, css: str, body_extra: str = '') -> str:
+    """
+    Render a full-screen map page for a figure.
+
+    Args:
+        fig: Plotly figure to embed
+        css: Style rules for the page (without the <style> tag)
+        body_extra: HTML appended to the end of the body
+
+    Returns:
+        HTML string of the page
+    """
+    return ''.join((
+        MAP_PAGE_HEAD, css, MAP_PAGE_BODY, fig.to_json(), MAP_PAGE_PLOT, body_extra, MAP_PAGE_TAIL
+    ))
+
+
 class GridMapGenerator:
     def __init__(self, data_loader):
         """Initialize with DataLoader instance for accessing grid data"""
         self.data_loader = data_loader
+        self._rating_calculator = RatingCalculator(data_loader)
+        self._lines_geojson = None
+        self._features_cached = []
+        self._feature_name_to_idx = {}
+        self._center = None
+        self._html_cache = OrderedDict()
+        self._html_cache_lock = threading.Lock()
+        # (weather_params, {line name: rating}) from the last rated map render
+        self._rating_snapshot = None
+        self._line_details_cache = OrderedDict()
+        self._line_details_lock = threading.Lock()
         try:
             self.lines_geojson = data_loader.get_lines_geojson()
             logger.info("Successfully loaded GeoJSON data with %d features", 
@@ -42,68 +321,179 @@ class GridMapGenerator:
                 logger.error("Failed to reload GeoJSON data: %s", str(e))
                 self.lines_geojson = None
 
+    @property
+    def lines_geojson(self) -> Optional[Dict]:
+        """Lines GeoJSON; assigning it rebuilds the per-feature geometry cache."""
+        return self._lines_geojson
+
+    @lines_geojson.setter
+    def lines_geojson(self, value: Optional[Dict]):
+        self._lines_geojson = value
+        self._build_feature_cache()
+
+    def _build_feature_cache(self):
+        """Precompute coordinate arrays, midpoints and the map center once per GeoJSON load"""
+        self._features_cached = []
+        self._feature_name_to_idx = {}
+        self._center = None
+        with self._html_cache_lock:
+            self._html_cache.clear()
+
+        if not self._lines_geojson:
+            return
+
+        all_pts = []
+        for feature in self._lines_geojson.get('features', []):
+            coords = feature['geometry']['coordinates']
+            pts = np.asarray(coords, dtype=np.float64)
+            all_pts.append(pts)
+            props = feature['properties']
+            # Midpoint and center use the original geometry; plotted vertices are
+            # simplified and rounded
+            midpoint = self.calculate_line_midpoint(coords)
+            plot_pts = np.round(simplify_line(pts, SIMPLIFY_TOLERANCE_DEG), COORD_DECIMALS)
+            midpoint_text = ""
+            if midpoint:
+                midpoint_text = f"<br>Midpoint: {midpoint[1]:.6f}°N, {midpoint[0]:.6f}°W"
+            self._features_cached.append({
+                'name': props['Name'],
+                'lons': plot_pts[:, 0].astype(np.float32),
+                'lats': plot_pts[:, 1].astype(np.float32),
+                'midpoint': midpoint,
+                'midpoint_text': midpoint_text,
+                'props': props,
+                **self._static_hover_text(props, midpoint_text)
+            })
+
+        for i, f in enumerate(self._features_cached):
+            self._feature_name_to_idx.setdefault(f['name'], []).append(i)
+
+        if all_pts:
+            center_lon, center_lat = np.concatenate(all_pts, axis=0).mean(axis=0)
+            self._center = (float(center_lat), float(center_lon))
+
+    @staticmethod
+    def _static_hover_text(props: Dict, midpoint_text: str) -> Dict[str, str]:
+        """Build the hover text fragments that do not depend on live ratings"""
+        title = f"<b style='font-size: 15px'>{props['LineName']}</b><br><br>"
+        connection = (
+            f"<b>Connection:</b><br>"
+            f"  From: {props['BusNameFrom']}<br>"
+            f"  To: {props['BusNameTo']}"
+            f"{midpoint_text}"
+        )
+
+        return {
+            'hover_title': title,
+            'hover_connection': connection,
+            'hover_unrated': (
+                f"{title}"
+                f"<b>Line Details:</b><br>"
+                f"  • Voltage: {props['nomkv']} kV<br>"
+                f"  • Circuit: {props['Circuit']}<br>"
+                f"<br>"
+                f"{connection}"
+            ),
+            'hover_voltage': (
+                f"<b>{props['LineName']}</b><br>"
+                f"Voltage: {props['nomkv']} kV<br>"
+                f"Circuit: {props['Circuit']}<br>"
+                f"From: {props['BusNameFrom']}<br>"
+                f"To: {props['BusNameTo']}"
+            )
+        }
+
     def calculate_line_midpoint(self, coords: List[List[float]]) -> Optional[List[float]]:
         """Calculate the geographic midpoint along a line string based on distance"""
         if len(coords) < 2:
             return None
 
-        # Calculate distances between consecutive points
-        total_distance = 0
-        segment_distances = []
-
-        for i in range(len(coords) - 1):
-            lon1, lat1 = coords[i]
-            lon2, lat2 = coords[i + 1]
+        pts = np.asarray(coords, dtype=float)
 
-            # Haversine distance
-            R = 6371  # Earth radius in km
-            dlat = math.radians(lat2 - lat1)
-            dlon = math.radians(lon2 - lon1)
-            a = math.sin(dlat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon/2)**2
-            c = 2 * math.asin(math.sqrt(a))
-            distance = R * c
+        if line_midpoint is not None:
+            # Compiled single-pass kernel (numba installed)
+            mid_lon, mid_lat = line_midpoint(
+                np.ascontiguousarray(pts[:, 0]), np.ascontiguousarray(pts[:, 1])
+            )
+            if np.isnan(mid_lon):
+                return coords[len(coords) // 2]
+            return [float(mid_lon), float(mid_lat)]
 
-            total_distance += distance
-            segment_distances.append(distance)
+        lon = np.radians(pts[:, 0])
+        lat = np.radians(pts[:, 1])
 
-        # Find the midpoint (half the total distance)
-        target_distance = total_distance / 2
-        accumulated = 0
+        # Haversine distance of every segment
+        R = 6371  # Earth radius in km
+        dlat = np.diff(lat)
+        dlon = np.diff(lon)
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(dlon / 2) ** 2
+        segment_distances = 2 * R * np.arcsin(np.sqrt(a))
 
-        for i, segment_dist in enumerate(segment_distances):
-            if accumulated + segment_dist >= target_distance:
-                # Interpolate within this segment
-                frac = (target_distance - accumulated) / segment_dist
-                lon1, lat1 = coords[i]
-                lon2, lat2 = coords[i + 1]
+        # Find the segment containing half the total distance
+        accumulated = np.cumsum(segment_distances)
+        target_distance = accumulated[-1] / 2
+        i = int(np.searchsorted(accumulated, target_distance))
 
-                mid_lon = lon1 + (lon2 - lon1) * frac
-                mid_lat = lat1 + (lat2 - lat1) * frac
-                return [mid_lon, mid_lat]
+        if i >= len(segment_distances) or segment_distances[i] == 0:
+            # Fallback to middle coordinate if calculation fails
+            return coords[len(coords) // 2]
 
-            accumulated += segment_dist
+        # Interpolate within this segment (in degree space)
+        previous = accumulated[i - 1] if i > 0 else 0.0
+        frac = (target_distance - previous) / segment_distances[i]
+        lon1, lat1 = pts[i, :2]
+        lon2, lat2 = pts[i + 1, :2]
 
-        # Fallback to middle coordinate if calculation fails
-        mid_idx = len(coords) // 2
-        return coords[mid_idx]
+        return [float(lon1 + (lon2 - lon1) * frac), float(lat1 + (lat2 - lat1) * frac)]
 
     def get_line_rating_data(self, line_name: str, weather_params: Dict) -> Optional[Dict]:
         """Get real-time rating data for a specific line"""
-        from rating_calculator import RatingCalculator
+        # Map clicks ask for lines of the map just rendered; reuse those ratings
+        if self._rating_snapshot is not None and self._rating_snapshot[0] == weather_params:
+            rating = self._rating_snapshot[1].get(line_name)
+            if rating is not None:
+                return dict(rating)
 
-        calculator = RatingCalculator(self.data_loader)
         line_data = self.data_loader.get_line_data(line_name)
 
         if line_data is None:
             return None
 
-        rating = calculator.calculate_line_rating(line_data, weather_params)
-        return rating
+        return self._rating_calculator.calculate_line_rating(line_data, weather_params)
+
+    @staticmethod
+    def _html_cache_key(*inputs) -> str:
+        """Digest of the JSON-serialized render inputs"""
+        payload = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def _cached_render(self, key: str, render) -> str:
+        """
+        Return cached HTML for key, rendering and storing it on a miss
+
+        Safe to call from concurrent request threads; rendering runs outside
+        the lock, so concurrent misses for one key may render it twice.
+        """
+        with self._html_cache_lock:
+            html_str = self._html_cache.get(key)
+            if html_str is not None:
+                self._html_cache.move_to_end(key)
+                return html_str
+
+        html_str = render()
+        with self._html_cache_lock:
+            self._html_cache[key] = html_str
+            if len(self._html_cache) > MAP_HTML_CACHE_SIZE:
+                self._html_cache.popitem(last=False)
+        return html_str
 
     def generate_interactive_map(self, weather_params: Dict, line_ratings: Dict = None) -> str:
         """
         Generate interactive Plotly map with real-time grid data
 
+        Identical weather and ratings produce identical HTML, so rendered
+        pages are cached (LRU, MAP_HTML_CACHE_SIZE entries).
+
         Args:
             weather_params: Current weather conditions
             line_ratings: Pre-calculated line ratings (optional)
@@ -114,141 +504,137 @@ class GridMapGenerator:
         if not self.lines_geojson:
             raise ValueError("No line GeoJSON data available")
 
+        if line_ratings:
+            self._rating_snapshot = (
+                dict(weather_params),
+                {rating['name']: rating for rating in line_ratings['lines']}
+            )
+
+        key = self._html_cache_key('interactive', weather_params, line_ratings)
+        return self._cached_render(
+            key, lambda: self._render_interactive_map(weather_params, line_ratings)
+        )
+
+    def _render_interactive_map(self, weather_params: Dict, line_ratings: Dict = None) -> str:
+        """Build the interactive map figure and HTML (uncached)"""
         # Create figure
         fig = go.Figure()
 
-        # Color scheme based on stress levels
-        stress_colors = {
-            'normal': 'rgba(0, 255, 180, 0.2)',   # neon teal
-            'caution': 'rgba(255, 204, 0, 0.35)', # amber
-            'high': 'rgba(255, 80, 0, 0.45)',     # orange-red
-            'critical': 'rgba(255, 0, 60, 0.5)'   # vivid red
-        }
-
         voltage_colors = {
             138.0: 'rgba(0, 122, 255, 0.85)',    # Apple blue - for 138kV
             69.0: 'rgba(255, 149, 0, 0.85)'      # Apple orange - for 69kV
         }
 
-        # Calculate center from line coordinates
-        all_coords = []
-        for feature in self.lines_geojson['features']:
-            for coord in feature['geometry']['coordinates']:
-                all_coords.append(coord)
-
-        center_lon = sum(c[0] for c in all_coords) / len(all_coords)
-        center_lat = sum(c[1] for c in all_coords) / len(all_coords)
+        # Map center is precomputed from line coordinates
+        center_lat, center_lon = self._center
 
         # Group lines by stress level if ratings available
         if line_ratings:
-            lines_by_stress = {'normal': [], 'caution': [], 'high': [], 'critical': []}
-            rating_dict = {r['name']: r for r in line_ratings['lines']}
+            n_features = len(self._features_cached)
+            stress_codes = np.zeros(n_features, dtype=np.int8)
+            feature_ratings = [None] * n_features
 
-            for feature in self.lines_geojson['features']:
-                line_name = feature['properties']['Name']
-                rating = rating_dict.get(line_name)
+            for rating in line_ratings['lines']:
+                for idx in self._feature_name_to_idx.get(rating['name'], ()):
+                    stress_codes[idx] = STRESS_LEVEL_CODES[rating['stress_level']]
+                    feature_ratings[idx] = rating
 
-                if rating:
-                    lines_by_stress[rating['stress_level']].append((feature, rating))
-                else:
-                    # Default to normal if no rating
-                    lines_by_stress['normal'].append((feature, None))
-
-            # Add lines grouped by stress level
-            for stress_level in ['normal', 'caution', 'high', 'critical']:
-                features = lines_by_stress[stress_level]
-
-                for idx, (feature, rating) in enumerate(features):
-                    coords = feature['geometry']['coordinates']
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
-
-                    # Calculate midpoint
-                    midpoint_coord = self.calculate_line_midpoint(coords)
-                    midpoint_text = ""
-                    if midpoint_coord:
-                        midpoint_text = f"<br>Midpoint: {midpoint_coord[1]:.6f}°N, {midpoint_coord[0]:.6f}°W"
-
-                    # Build hover text with real-time data
-                    if rating:
-                        line_info = (
-                            f"<b style='font-size: 15px'>{feature['properties']['LineName']}</b><br>"
-                            f"<br>"
-                            f"<b style='color: {stress_colors[stress_level].replace('0.85', '1.0')}; font-size: 15px'>⚡ Loading: {rating['loading_pct']:.1f}%</b><br>"
-                            f"<br>"
-                            f"<b>Power Flow:</b><br>"
-                            f"  • Flow: {rating['flow_mva']:.1f} MVA<br>"
-                            f"  • Rating: {rating['rating_mva']:.1f} MVA<br>"
-                            f"  • Margin: {rating['margin_mva']:.1f} MVA<br>"
-                            f"<br>"
-                            f"<b>Line Details:</b><br>"
-                            f"  • Voltage: {rating['voltage_kv']} kV<br>"
-                            f"  • Conductor: {rating['conductor']}<br>"
-                            f"<br>"
-                            f"<b>Connection:</b><br>"
-                            f"  From: {feature['properties']['BusNameFrom']}<br>"
-                            f"  To: {feature['properties']['BusNameTo']}"
-                            f"{midpoint_text}"
-                        )
-                    else:
-                        line_info = (
-                            f"<b style='font-size: 15px'>{feature['properties']['LineName']}</b><br>"
-                            f"<br>"
-                            f"<b>Line Details:</b><br>"
-                            f"  • Voltage: {feature['properties']['nomkv']} kV<br>"
-                            f"  • Circuit: {feature['properties']['Circuit']}<br>"
-                            f"<br>"
-                            f"<b>Connection:</b><br>"
-                            f"  From: {feature['properties']['BusNameFrom']}<br>"
-                            f"  To: {feature['properties']['BusNameTo']}"
-                            f"{midpoint_text}"
-                        )
+            # Stable sort by stress code keeps GeoJSON order within each level;
+            # lines without a rating default to normal
+            order = np.argsort(stress_codes, kind='stable')
+            boundaries = np.cumsum(np.bincount(stress_codes, minlength=len(STRESS_LEVELS)))[:-1]
+
+            # Add one trace per stress level; lines are separated by null gaps
+            for stress_level, feature_idx in zip(STRESS_LEVELS, np.split(order, boundaries)):
+                if len(feature_idx) == 0:
+                    continue
 
+                line_style = dict(
+                    width=4.5 if stress_level in ['high', 'critical'] else 3,
+                    color=STRESS_COLORS[stress_level]
+                )
+                trace_lons, trace_lats, trace_rows = [], [], []
+                unrated_lons, unrated_lats, unrated_hover = [], [], []
+
+                for i in feature_idx.tolist():
+                    cached = self._features_cached[i]
+                    rating = feature_ratings[i]
+
+                    if not rating:
+                        unrated_lons.append(cached['lons'])
+                        unrated_lats.append(cached['lats'])
+                        unrated_hover.append(cached['hover_unrated'])
+                        continue
+
+                    # Raw values only; Plotly.js formats them into the hover template
+                    row = [
+                        cached['name'],
+                        cached['props']['LineName'],
+                        rating['loading_pct'],
+                        rating['flow_mva'],
+                        rating['rating_mva'],
+                        rating['margin_mva'],
+                        str(rating['voltage_kv']),
+                        rating['conductor'],
+                        cached['hover_connection']
+                    ]
+                    trace_lons.append(cached['lons'])
+                    trace_lats.append(cached['lats'])
+                    trace_rows.append(row)
+
+                if trace_lons:
                     fig.add_trace(go.Scattermapbox(
-                        lon=lons,
-                        lat=lats,
+                        lon=join_with_gaps(trace_lons),
+                        lat=join_with_gaps(trace_lats),
                         mode='lines',
-                        line=dict(
-    width=4.5 if stress_level in ['high', 'critical'] else 3,
-    color=stress_colors[stress_level]
-),
+                        line=line_style,
+                        hovertemplate=RATED_HOVER_TEMPLATE.format(color=STRESS_COLORS_SOLID[stress_level]),
+                        name=f'{stress_level.title()} Lines',
+                        legendgroup=stress_level,
+                        customdata=line_index_customdata([len(lons) for lons in trace_lons]),
+                        meta=dict(lookup=dict(customdata=trace_rows))
+                    ))
+
+                # Lines missing from the ratings keep their static hover text
+                if unrated_lons:
+                    fig.add_trace(go.Scattermapbox(
+                        lon=join_with_gaps(unrated_lons),
+                        lat=join_with_gaps(unrated_lats),
+                        mode='lines',
+                        line=line_style,
                         hoverinfo='text',
-                        hovertext=line_info,
+                        customdata=line_index_customdata([len(lons) for lons in unrated_lons]),
+                        meta=dict(lookup=dict(hovertext=unrated_hover)),
                         name=f'{stress_level.title()} Lines',
-                        showlegend=(idx == 0),
                         legendgroup=stress_level,
-                        customdata=[[line_name, rating]] if rating else [[line_name, None]]
+                        showlegend=not trace_lons
                     ))
         else:
             # Fallback to voltage-based coloring if no ratings
             for voltage, color in voltage_colors.items():
-                voltage_lines = [f for f in self.lines_geojson['features']
-                                if f['properties']['nomkv'] == voltage]
+                voltage_lines = [f for f in self._features_cached
+                                if f['props']['nomkv'] == voltage]
+                if not voltage_lines:
+                    continue
 
-                for idx, feature in enumerate(voltage_lines):
-                    coords = feature['geometry']['coordinates']
-                    lons = [c[0] for c in coords]
-                    lats = [c[1] for c in coords]
+                trace_lons, trace_lats, trace_hover = [], [], []
 
-                    line_info = (
-                        f"<b>{feature['properties']['LineName']}</b><br>"
-                        f"Voltage: {feature['properties']['nomkv']} kV<br>"
-                        f"Circuit: {feature['properties']['Circuit']}<br>"
-                        f"From: {feature['properties']['BusNameFrom']}<br>"
-                        f"To: {feature['properties']['BusNameTo']}"
-                    )
+                for cached in voltage_lines:
+                    trace_lons.append(cached['lons'])
+                    trace_lats.append(cached['lats'])
+                    trace_hover.append(cached['hover_voltage'])
 
-                    fig.add_trace(go.Scattermapbox(
-                        lon=lons,
-                        lat=lats,
-                        mode='lines',
-                        line=dict(width=4.5, color=color),
-                        hoverinfo='text',
-                        hovertext=line_info,
-                        name=f'{int(voltage)} kV Lines',
-                        showlegend=(idx == 0),
-                        legendgroup=f'{voltage}kV'
-                    ))
+                fig.add_trace(go.Scattermapbox(
+                    lon=join_with_gaps(trace_lons),
+                    lat=join_with_gaps(trace_lats),
+                    mode='lines',
+                    line=dict(width=4.5, color=color),
+                    hoverinfo='text',
+                    customdata=line_index_customdata([len(lons) for lons in trace_lons]),
+                    meta=dict(lookup=dict(hovertext=trace_hover)),
+                    name=f'{int(voltage)} kV Lines',
+                    legendgroup=f'{voltage}kV'
+                ))
 
         # Layout with Apple Maps styling - full screen
         fig.update_layout(
@@ -262,6 +648,7 @@ class GridMapGenerator:
             height=None,  # Auto height
             autosize=True,  # Auto resize
             hovermode='closest',
+            showlegend=True,  # Keep the legend even when only one group is present
             hoverlabel=dict(
                 bgcolor='rgba(15, 15, 17, 0.95)',
                 font_size=14,
@@ -287,130 +674,15 @@ class GridMapGenerator:
         );
 
 
-        # Generate HTML and inject custom CSS to remove all margins
-        # Enable scrollZoom and interactions
-        config = {
-            'scrollZoom': True,
-            'displayModeBar': False,  # Hide the plotly toolbar
-            'dragmode': 'pan'
-        }
-        html_str = fig.to_html(include_plotlyjs='cdn', div_id='grid-map', config=config)
-
-        # Add CSS and custom zoom controls
-        custom_css = """
-        <style>
-            html, body {
-                margin: 0 !important;
-                padding: 0 !important;
-                width: 100% !important;
-                height: 100% !important;
-                overflow: hidden !important;
-            }
-            .plotly-graph-div {
-                width: 100% !important;
-                height: 100vh !important;
-                margin: 0 !important;
-                padding: 0 !important;
-            }
-            #grid-map {
-                width: 100% !important;
-                height: 100vh !important;
-                margin: 0 !important;
-                padding: 0 !important;
-            }
-
-            /* Custom zoom controls */
-            .custom-zoom-controls {
-                position: fixed;
-                top: 20px;
-                left: 20px;
-                z-index: 1000;
-                display: flex;
-                flex-direction: column;
-                gap: 8px;
-                background: rgba(20, 20, 22, 0.9);
-                backdrop-filter: blur(10px);
-                border-radius: 8px;
-                padding: 8px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                box-shadow: 0 4px 16px rgba(0, 0, 0, 0.4);
-            }
-
-            .zoom-btn {
-                width: 36px;
-                height: 36px;
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: 600;
-                cursor: pointer;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                transition: all 0.2s;
-            }
-
-            .zoom-btn:hover {
-                background: rgba(255, 255, 255, 0.2);
-                transform: scale(1.05);
-            }
-
-            .zoom-btn:active {
-                transform: scale(0.95);
-            }
-        </style>
-        """
-
-        # Add zoom control JavaScript
-        zoom_controls = """
-        <div class="custom-zoom-controls">
-            <button class="zoom-btn" onclick="zoomIn()">+</button>
-            <button class="zoom-btn" onclick="zoomOut()">−</button>
-        </div>
-
-        <script>
-            function zoomIn() {
-                const plotDiv = document.getElementById('grid-map');
-                if (plotDiv && plotDiv.layout && plotDiv.layout.mapbox) {
-                    const currentZoom = plotDiv.layout.mapbox.zoom || 12;
-                    Plotly.relayout(plotDiv, {'mapbox.zoom': currentZoom + 0.5});
-                }
-            }
-
-            function zoomOut() {
-                const plotDiv = document.getElementById('grid-map');
-                if (plotDiv && plotDiv.layout && plotDiv.layout.mapbox) {
-                    const currentZoom = plotDiv.layout.mapbox.zoom || 12;
-                    Plotly.relayout(plotDiv, {'mapbox.zoom': Math.max(1, currentZoom - 0.5)});
-                }
-            }
-
-            // Enable scroll zoom on the map
-            document.addEventListener('DOMContentLoaded', function() {
-                const plotDiv = document.getElementById('grid-map');
-                if (plotDiv) {
-                    plotDiv.on('plotly_relayout', function(eventData) {
-                        // Allow zoom interactions
-                    });
-                }
-            });
-        </script>
-        """
-
-        # Inject CSS after the <head> tag
-        html_str = html_str.replace('<head>', '<head>' + custom_css)
-
-        # Inject zoom controls before closing body tag
-        html_str = html_str.replace('</body>', zoom_controls + '</body>')
-
-        return html_str
+        # Assemble the page from the static template around the figure JSON
+        return render_map_page(fig, MAP_CSS + ZOOM_CONTROLS_CSS, ZOOM_CONTROLS_HTML)
 
     def generate_outage_map(self, outage_result: Dict) -> str:
         """
         Generate interactive map with outage simulation results
 
+        Rendered pages are cached per outage result, like generate_interactive_map.
+
         Args:
             outage_result: Outage simulation result from OutageSimulator
 
@@ -420,6 +692,13 @@ class GridMapGenerator:
         if not self.lines_geojson:
             raise ValueError("No line GeoJSON data available")
 
+        key = self._html_cache_key('outage', outage_result)
+        return self._cached_render(
+            key, lambda: self._render_outage_map(outage_result)
+        )
+
+    def _render_outage_map(self, outage_result: Dict) -> str:
+        """Build the outage map figure and HTML (uncached)"""
         # Create figure
         fig = go.Figure()
 
@@ -432,14 +711,8 @@ class GridMapGenerator:
             'normal': 'rgba(0, 255, 180, 0.2)'         # Teal for normal
         }
 
-        # Calculate center from line coordinates
-        all_coords = []
-        for feature in self.lines_geojson['features']:
-            for coord in feature['geometry']['coordinates']:
-                all_coords.append(coord)
-
-        center_lon = sum(c[0] for c in all_coords) / len(all_coords)
-        center_lat = sum(c[1] for c in all_coords) / len(all_coords)
+        # Map center is precomputed from line coordinates
+        center_lat, center_lon = self._center
 
         # Build lookup dictionaries from outage results
         outaged_lines = set(outage_result.get('outage_lines', []))
@@ -454,49 +727,48 @@ class GridMapGenerator:
             'normal': []
         }
 
-        for feature in self.lines_geojson['features']:
-            line_name = feature['properties']['Name']
+        for cached in self._features_cached:
+            line_name = cached['name']
             line_data = loading_dict.get(line_name)
 
             if line_name in outaged_lines:
-                lines_by_status['outaged'].append((feature, line_data))
+                lines_by_status['outaged'].append((cached, line_data))
             elif line_data:
                 status = line_data.get('status', 'normal')
                 if status in lines_by_status:
-                    lines_by_status[status].append((feature, line_data))
+                    lines_by_status[status].append((cached, line_data))
                 else:
-                    lines_by_status['normal'].append((feature, line_data))
+                    lines_by_status['normal'].append((cached, line_data))
             else:
-                lines_by_status['normal'].append((feature, None))
+                lines_by_status['normal'].append((cached, None))
 
         # Add lines grouped by status (outaged lines last so they appear on bottom)
         for status in ['normal', 'affected', 'high_stress', 'overloaded', 'outaged']:
             features = lines_by_status[status]
+            if not features:
+                continue
+
+            trace_lons, trace_lats, trace_hover = [], [], []
 
-            for idx, (feature, line_data) in enumerate(features):
-                coords = feature['geometry']['coordinates']
-                lons = [c[0] for c in coords]
-                lats = [c[1] for c in coords]
+            for cached, line_data in features:
+                props = cached['props']
 
-                # Calculate midpoint
-                midpoint_coord = self.calculate_line_midpoint(coords)
-                midpoint_text = ""
-                if midpoint_coord:
-                    midpoint_text = f"<br>Midpoint: {midpoint_coord[1]:.6f}°N, {midpoint_coord[0]:.6f}°W"
+                # Midpoint text is formatted once per feature
+                midpoint_text = cached['midpoint_text']
 
                 # Build hover text with outage data
                 if line_data:
                     if status == 'outaged':
                         line_info = (
-                            f"<b style='font-size: 15px; color: #888'>{feature['properties']['LineName']}</b><br>"
+                            f"<b style='font-size: 15px; color: #888'>{props['LineName']}</b><br>"
                             f"<br>"
                             f"<b style='color: #ff3c3c; font-size: 15px'>⚠️ STATUS: OUTAGED</b><br>"
                             f"<br>"
                             f"<b>Status:</b> Line removed from service<br>"
                             f"<br>"
                             f"<b>Connection:</b><br>"
-                            f"  From: {feature['properties']['BusNameFrom']}<br>"
-                            f"  To: {feature['properties']['BusNameTo']}"
+                            f"  From: {props['BusNameFrom']}<br>"
+                            f"  To: {props['BusNameTo']}"
                             f"{midpoint_text}"
                         )
                     else:
@@ -507,7 +779,7 @@ class GridMapGenerator:
                         status_color = stress_colors[status].replace('0.6', '1.0').replace('0.5', '1.0').replace('0.4', '1.0')
 
                         line_info = (
-                            f"<b style='font-size: 15px'>{feature['properties']['LineName']}</b><br>"
+                            f"<b style='font-size: 15px'>{props['LineName']}</b><br>"
                             f"<br>"
                             f"<b style='color: {status_color}; font-size: 15px'>⚡ Loading: {line_data['loading_pct']:.1f}%</b><br>"
                             f"<b style='color: {change_color}'>Change: {change_arrow} {abs(line_data.get('loading_change_pct', 0)):.1f}%</b><br>"
@@ -521,43 +793,49 @@ class GridMapGenerator:
                             f"  • Capacity: {line_data.get('s_nom', 0):.1f} MVA<br>"
                             f"<br>"
                             f"<b>Connection:</b><br>"
-                            f"  From: {feature['properties']['BusNameFrom']}<br>"
-                            f"  To: {feature['properties']['BusNameTo']}"
+                            f"  From: {props['BusNameFrom']}<br>"
+                            f"  To: {props['BusNameTo']}"
                             f"{midpoint_text}"
                         )
                 else:
                     line_info = (
-                        f"<b style='font-size: 15px'>{feature['properties']['LineName']}</b><br>"
+                        f"<b style='font-size: 15px'>{props['LineName']}</b><br>"
                         f"<br>"
                         f"<b>Line Details:</b><br>"
-                        f"  • Voltage: {feature['properties']['nomkv']} kV<br>"
+                        f"  • Voltage: {props['nomkv']} kV<br>"
                         f"<br>"
                         f"<b>Connection:</b><br>"
-                        f"  From: {feature['properties']['BusNameFrom']}<br>"
-                        f"  To: {feature['properties']['BusNameTo']}"
+                        f"  From: {props['BusNameFrom']}<br>"
+                        f"  To: {props['BusNameTo']}"
                         f"{midpoint_text}"
                     )
 
-                # Special styling for outaged lines
-                line_style = dict(
-                    width=5 if status in ['overloaded', 'high_stress'] else (2 if status == 'outaged' else 3),
-                    color=stress_colors[status]
-                )
-
-                # Note: Scattermapbox does not support 'dash' property for lines
-                # Outaged lines are shown with different color and width instead
-
-                fig.add_trace(go.Scattermapbox(
-                    lon=lons,
-                    lat=lats,
-                    mode='lines',
-                    line=line_style,
-                    hoverinfo='text',
-                    hovertext=line_info,
-                    name=f'{status.replace("_", " ").title()} Lines',
-                    showlegend=(idx == 0),
-                    legendgroup=status
-                ))
+                trace_lons.append(cached['lons'])
+                trace_lats.append(cached['lats'])
+                trace_hover.append(line_info)
+
+            # Special styling for outaged lines
+            line_style = dict(
+                width=5 if status in ['overloaded', 'high_stress'] else (2 if status == 'outaged' else 3),
+                color=stress_colors[status]
+            )
+
+            # Note: Scattermapbox does not support 'dash' property for lines
+            # Outaged lines are shown with different color and width instead
+
+            # One trace per status; lines are separated by null gaps and each
+            # line's hover text is sent once
+            fig.add_trace(go.Scattermapbox(
+                lon=join_with_gaps(trace_lons),
+                lat=join_with_gaps(trace_lats),
+                mode='lines',
+                line=line_style,
+                hoverinfo='text',
+                customdata=line_index_customdata([len(lons) for lons in trace_lons]),
+                meta=dict(lookup=dict(hovertext=trace_hover)),
+                name=f'{status.replace("_", " ").title()} Lines',
+                legendgroup=status
+            ))
 
         # Layout with dark map styling
         fig.update_layout(
@@ -595,45 +873,53 @@ class GridMapGenerator:
             plot_bgcolor='#0b0b0d'
         )
 
-        # Generate HTML
-        config = {
-            'scrollZoom': True,
-            'displayModeBar': False,
-            'dragmode': 'pan'
-        }
-        html_str = fig.to_html(include_plotlyjs='cdn', div_id='grid-map', config=config)
-
-        # Add custom CSS (reuse from generate_interactive_map)
-        custom_css = """
-        <style>
-            html, body {
-                margin: 0 !important;
-                padding: 0 !important;
-                width: 100% !important;
-                height: 100% !important;
-                overflow: hidden !important;
-            }
-            .plotly-graph-div {
-                width: 100% !important;
-                height: 100vh !important;
-                margin: 0 !important;
-                padding: 0 !important;
-            }
-            #grid-map {
-                width: 100% !important;
-                height: 100vh !important;
-                margin: 0 !important;
-                padding: 0 !important;
-            }
-        </style>
-        """
-
-        html_str = html_str.replace('<head>', '<head>' + custom_css)
-
-        return html_str
+        # Assemble the page from the static template around the figure JSON
+        return render_map_page(fig, MAP_CSS)
+
+    def clear_line_details_cache(self):
+        """Drop memoized chatbot line details (e.g. after line data changes)"""
+        with self._line_details_lock:
+            self._line_details_cache.clear()
+
+    @staticmethod
+    def _bucket_weather(weather_params: Dict) -> Dict:
+        """Round weather to LINE_DETAILS_WEATHER_BUCKETS so close values share a rating"""
+        bucketed = {}
+        for k, v in weather_params.items():
+            if isinstance(v, numbers.Real) and not isinstance(v, bool):
+                step = LINE_DETAILS_WEATHER_BUCKETS.get(k)
+                v = float(round(v / step) * step) if step else float(v)
+            bucketed[k] = v
+        return bucketed
 
     def get_line_details_for_chat(self, line_name: str, weather_params: Dict) -> Dict:
-        """Get comprehensive line details formatted for chatbot responses"""
+        """
+        Get comprehensive line details formatted for chatbot responses
+
+        Weather is rounded to LINE_DETAILS_WEATHER_BUCKETS and the line is
+        rated for the rounded values, so follow-up questions with nearly the
+        same weather reuse the result (LRU, LINE_DETAILS_CACHE_SIZE entries,
+        safe to call from concurrent request threads).
+        """
+        weather = self._bucket_weather(weather_params)
+        key = (line_name, tuple(sorted((k, str(v)) for k, v in weather.items())))
+        with self._line_details_lock:
+            details = self._line_details_cache.get(key)
+            if details is not None:
+                self._line_details_cache.move_to_end(key)
+                return dict(details)
+
+        # Rate outside the lock; concurrent misses for one key compute the same result
+        details = self._build_line_details(line_name, weather)
+        with self._line_details_lock:
+            self._line_details_cache[key] = details
+            if len(self._line_details_cache) > LINE_DETAILS_CACHE_SIZE:
+                self._line_details_cache.popitem(last=False)
+
+        return dict(details)
+
+    def _build_line_details(self, line_name: str, weather_params: Dict) -> Dict:
+        """Compute the chatbot line details (uncached)"""
         rating = self.get_line_rating_data(line_name, weather_params)
 
         if not rating:
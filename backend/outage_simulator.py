@@ -7,16 +7,28 @@ and analyzes the resulting impacts on grid stress, connectivity, and line loadin
 Based on the PyPSA power flow analysis approach, similar to the provided example notebook.
 """
 
+import os
 import pandas as pd
 import numpy as np
 import pypsa
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
 from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 from config import DataConfig
+from loading_kernels import LINE_STATUS_NAMES, compute_line_stats
 
 logger = logging.getLogger(__name__)
 
+# Status name for each loading_kernels status code
+LINE_STATUS_ARRAY = np.array(LINE_STATUS_NAMES)
+
+# Linear-flow contingency results above this max loading are re-solved with AC power flow
+PF_REFINE_LOADING_PCT = 85.0
+
 
 def convert_numpy_types(obj):
     """
@@ -50,6 +62,39 @@ def convert_numpy_types(obj):
         return obj
 
 
+# Per-process simulator used by the contingency worker pool
+_worker_simulator = None
+
+
+def _init_worker():
+    """Load the PyPSA network once per worker process."""
+    global _worker_simulator
+    _worker_simulator = OutageSimulator()
+
+
+def create_worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool for run_multiple_contingency_scenarios to reuse.
+
+    Each worker loads its own network once at startup, so a long-lived pool
+    amortizes that cost over many calls. Create it at startup, before any
+    threads are running.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor: Pool whose workers hold an OutageSimulator
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker)
+
+
+def _simulate_outage_worker(outage_lines: List[str], use_lpf: bool = False,
+                            detailed: bool = True) -> Dict[str, Any]:
+    """Simulate one outage scenario on the worker's own network copy."""
+    return _worker_simulator.simulate_outage(outage_lines, use_lpf=use_lpf, detailed=detailed)
+
+
 class OutageSimulator:
     """
     Simulates transmission line outages and analyzes grid impacts.
@@ -62,7 +107,12 @@ class OutageSimulator:
         """Initialize the outage simulator with PyPSA network."""
         self.network = None
         self.baseline_flows = None
-        self.baseline_loading = None
+        self.baseline_loading_arr = None
+        self._baseline_active = None
+        self._baseline_v_mag = None
+        self._baseline_v_ang = None
+        self._outage_factors = None
+        self._line_idx = {}
         self._load_network()
 
     def _load_network(self):
@@ -92,12 +142,14 @@ class OutageSimulator:
             logger.error(f"Error loading PyPSA network: {e}")
             raise RuntimeError(f"Failed to load PyPSA network: {e}")
 
-    def _run_power_flow(self, use_lpf=False):
+    def _run_power_flow(self, use_lpf=False, use_seed=False):
         """
         Run power flow analysis.
 
         Args:
             use_lpf: If True, use linear power flow approximation (faster, less accurate)
+            use_seed: Start Newton-Raphson from the voltages currently stored in
+                buses_t instead of a flat start
 
         Returns:
             dict: Power flow convergence info
@@ -107,7 +159,7 @@ class OutageSimulator:
                 self.network.lpf()
                 return {'converged': True, 'linear': True}
             else:
-                info = self.network.pf()
+                info = self.network.pf(use_seed=use_seed)
                 converged = bool(info.converged.any().any())
                 max_error = float(info.error.max().max())
 
@@ -122,6 +174,19 @@ class OutageSimulator:
             logger.error(f"Power flow failed: {e}")
             raise
 
+    def _line_flow_row(self) -> np.ndarray:
+        """
+        Active power flow of every line in the first/only snapshot.
+
+        Returns:
+            np.ndarray: p0 (MW) aligned with network.lines.index
+        """
+        p0 = self.network.lines_t['p0']
+        if p0.columns.equals(self.network.lines.index):
+            return p0.to_numpy(dtype=float)[0]
+        # Columns out of line order (or missing): fall back to label alignment
+        return p0.iloc[0].reindex(self.network.lines.index).to_numpy(dtype=float)
+
     def _store_baseline(self):
         """Store baseline flows and loading for comparison."""
         if self.network is None:
@@ -130,30 +195,134 @@ class OutageSimulator:
         # Store baseline line flows (p0 = active power flow from bus0)
         self.baseline_flows = self.network.lines_t['p0'].copy()
 
-        # Get the snapshot index (use the first/only snapshot)
-        snapshot = self.network.snapshots[0]
+        # Line in-service flags, restored before each outage simulation
+        self._baseline_active = self.network.lines['active'].copy()
 
-        # Calculate baseline loading percentages
-        self.baseline_loading = {}
-        for line_name in self.network.lines.index:
-            flow = abs(self.network.lines_t['p0'].loc[snapshot, line_name])
-            s_nom = self.network.lines.loc[line_name, 's_nom']
-            if s_nom > 0:
-                self.baseline_loading[line_name] = (flow / s_nom) * 100
-            else:
-                self.baseline_loading[line_name] = 0.0
+        # Solved bus voltages, used as the starting point of outage power flows
+        self._baseline_v_mag = self.network.buses_t['v_mag_pu'].copy()
+        self._baseline_v_ang = self.network.buses_t['v_ang'].copy()
+
+        # Baseline loading percentages aligned with network.lines.index
+        # (use the first/only snapshot)
+        lines = self.network.lines
+        flow = np.abs(self._line_flow_row())
+        s_nom = lines['s_nom'].to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.baseline_loading_arr = np.where(s_nom > 0, flow / s_nom * 100, 0.0)
+        self._line_idx = {name: i for i, name in enumerate(lines.index)}
+
+        # Linear outage factors are built on first use from this baseline
+        self._outage_factors = None
+
+    def _build_outage_factors(self) -> Optional[Dict[str, Any]]:
+        """
+        Factor the intact network's linear power flow once for outage updates.
+
+        Returns:
+            dict: Branch PTDF matrix (branch_ptdf), intact linear branch flows
+            (flows), branch position of every line (branch_pos) and of each
+            network.lines row (line_rows); None if the network is not a single
+            AC sub-network
+        """
+        # Solve the intact network, keeping the caller's line outages
+        active = self.network.lines['active'].copy()
+        self._restore_baseline_state()
+        self.network.lpf()
+        sub_networks = self.network.sub_networks
+        if len(sub_networks) != 1 or sub_networks['carrier'].iloc[0] != 'AC':
+            self._restore_baseline_state()
+            self.network.lines['active'] = active
+            return None
+
+        sub_network = sub_networks['obj'].iloc[0]
+        sub_network.calculate_PTDF()
+        branches = sub_network.branches_i()
+
+        # Flow change on every branch per unit transfer across each branch
+        branch_ptdf = np.asarray((sub_network.K.T @ sub_network.PTDF.T).T)
+
+        line_flows = self.network.lines_t['p0'].iloc[0]
+        transformer_flows = self.network.transformers_t['p0'].iloc[0]
+        flows = np.array([
+            line_flows[name] if component == 'Line' else transformer_flows[name]
+            for component, name in branches
+        ], dtype=float)
+        branch_pos = {name: i for i, (component, name) in enumerate(branches) if component == 'Line'}
+
+        self._restore_baseline_state()
+        self.network.lines['active'] = active
+        return {
+            'branch_ptdf': branch_ptdf,
+            'flows': flows,
+            'branch_pos': branch_pos,
+            'line_rows': np.array([branch_pos[name] for name in self.network.lines.index]),
+        }
+
+    def _apply_line_removal_lowrank(self, outage_lines: List[str]) -> bool:
+        """
+        Linear power flow after removing lines, as a low-rank update of the intact solve.
+
+        Removing k branches is a rank-k change of the network, so the new flows
+        follow from the intact flows and branch PTDF via the Woodbury identity
+        (line outage distribution factors) without refactoring the network.
+        The flows are written to lines_t['p0'].
+
+        Args:
+            outage_lines: Lines to remove
+
+        Returns:
+            bool: False if the update does not apply (the outage splits the
+            network) and network.lpf() must be used instead
+        """
+        if self._outage_factors is None:
+            self._outage_factors = self._build_outage_factors() or {}
+        factors = self._outage_factors
+        if not factors:
+            return False
+
+        k = np.array([factors['branch_pos'][name] for name in dict.fromkeys(outage_lines)])
+        H = factors['branch_ptdf']
+        flows = factors['flows']
+
+        # Transfers across the removed branches that cancel their flow; A is
+        # singular when the removed branches disconnect part of the network
+        A = np.eye(len(k)) - H[np.ix_(k, k)]
+        if np.linalg.svd(A, compute_uv=False).min() < 1e-9:
+            return False
+        post = flows + H[:, k] @ np.linalg.solve(A, flows[k])
+        post[k] = 0.0
+
+        self.network.lines_t['p0'].iloc[0] = post[factors['line_rows']]
+        return True
 
     def reload_network(self):
         """Reload network from scratch (resets all outages)."""
         self._load_network()
 
-    def simulate_outage(self, outage_lines: List[str], use_lpf: bool = False) -> Dict[str, Any]:
+    def _restore_baseline_state(self):
+        """
+        Undo the changes simulate_outage makes to the loaded network.
+
+        Restores line in-service flags and line flows, and resets bus voltages
+        to the baseline solution so the next outage power flow is warm-started
+        from the intact network's operating point.
+        """
+        self.network.lines['active'] = self._baseline_active.copy()
+        self.network.lines_t['p0'] = self.baseline_flows.copy()
+        self.network.buses_t['v_mag_pu'] = self._baseline_v_mag.copy()
+        self.network.buses_t['v_ang'] = self._baseline_v_ang.copy()
+
+    def simulate_outage(self, outage_lines: List[str], use_lpf: bool = False,
+                        detailed: bool = True) -> Dict[str, Any]:
         """
         Simulate the outage of one or more transmission lines.
 
         Args:
             outage_lines: List of line names to remove (e.g., ['L48', 'L49'])
             use_lpf: Use linear power flow (faster but less accurate)
+            detailed: Include every line in loading_changes. When False only
+                outaged, stressed and affected lines are included and the
+                loading of every line is returned in loading_summary_array
 
         Returns:
             dict: Comprehensive outage analysis results including:
@@ -166,11 +335,11 @@ class OutageSimulator:
                 - loading_changes: Detailed before/after comparison
                 - metrics: Summary statistics
         """
-        # Reload network to ensure clean state
-        self.reload_network()
+        # Reset outages from any previous simulation (much cheaper than reload_network())
+        self._restore_baseline_state()
 
         # Validate that all specified lines exist
-        invalid_lines = [line for line in outage_lines if line not in self.network.lines.index]
+        invalid_lines = [line for line in outage_lines if line not in self._line_idx]
         if invalid_lines:
             return {
                 'success': False,
@@ -183,15 +352,29 @@ class OutageSimulator:
         # Get the snapshot index (use the first/only snapshot)
         snapshot = self.network.snapshots[0]
 
-        # Disable the outaged lines
-        for line_name in outage_lines:
-            self.network.lines.loc[line_name, "active"] = False
-            # Clear old solve data for disabled lines
-            self.network.lines_t['p0'].loc[snapshot, line_name] = 0.0
+        # Disable the outaged lines and clear their old solve data in one assignment each
+        # (deduplicated: a repeated label would add duplicate p0 columns)
+        unique_outages = list(dict.fromkeys(outage_lines))
+        self.network.lines.loc[unique_outages, "active"] = False
+        self.network.lines_t['p0'].loc[snapshot, unique_outages] = 0.0
+
+        # A part of the grid cut off from every generator has no slack bus, so
+        # the AC power flow cannot be solved; go straight to the linear approximation
+        islanded_buses = self._detect_islanded_buses(outage_lines)
+        solve_lpf = use_lpf
+        if islanded_buses and not use_lpf:
+            logger.warning(
+                f"Outage islands {len(islanded_buses)} buses from all generation, "
+                f"skipping AC power flow"
+            )
+            solve_lpf = True
 
         # Run power flow with outages
         try:
-            pf_info = self._run_power_flow(use_lpf=use_lpf)
+            if solve_lpf and self._apply_line_removal_lowrank(outage_lines):
+                pf_info = {'converged': True, 'linear': True}
+            else:
+                pf_info = self._run_power_flow(use_lpf=solve_lpf, use_seed=True)
         except Exception as e:
             return {
                 'success': False,
@@ -199,7 +382,7 @@ class OutageSimulator:
                 'outage_lines': outage_lines
             }
 
-        if not pf_info['converged'] and not use_lpf:
+        if not pf_info['converged'] and not solve_lpf:
             # Try again with linear power flow
             logger.warning("Nonlinear power flow did not converge, trying linear approximation...")
             try:
@@ -211,20 +394,33 @@ class OutageSimulator:
                     'outage_lines': outage_lines
                 }
 
+        if islanded_buses:
+            # Nothing flows inside an island without generation
+            island = [bus['bus_id'] for bus in islanded_buses]
+            lines = self.network.lines
+            in_island = (lines['bus0'].isin(island) | lines['bus1'].isin(island)).to_numpy()
+            self.network.lines_t['p0'].loc[snapshot, lines.index[in_island]] = 0.0
+            pf_info['islanded'] = True
+
         # Analyze results
-        analysis = self._analyze_outage_results(outage_lines)
+        analysis = self._analyze_outage_results(outage_lines, detailed=detailed,
+                                                islanded_buses=islanded_buses)
         analysis['power_flow_info'] = pf_info
         analysis['success'] = True
 
         # Convert all numpy types to native Python types for JSON serialization
         return convert_numpy_types(analysis)
 
-    def _analyze_outage_results(self, outage_lines: List[str]) -> Dict[str, Any]:
+    def _analyze_outage_results(self, outage_lines: List[str], detailed: bool = True,
+                                islanded_buses: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Analyze the post-outage network state.
 
         Args:
             outage_lines: List of lines that were removed
+            detailed: Build a loading_changes record for every line rather
+                than only the outaged, stressed and affected ones
+            islanded_buses: Result of _detect_islanded_buses() if already known
 
         Returns:
             dict: Analysis results
@@ -239,82 +435,100 @@ class OutageSimulator:
             'metrics': {}
         }
 
-        # Get active lines (excluding outaged ones)
-        active_lines = self.network.lines[self.network.lines['active']].index
-
-        # Get the snapshot index (use the first/only snapshot)
-        snapshot = self.network.snapshots[0]
-
-        # Calculate loading for each active line
-        loading_data = []
-        for line_name in self.network.lines.index:
-            flow_mw = abs(self.network.lines_t['p0'].loc[snapshot, line_name])
-            s_nom = self.network.lines.loc[line_name, 's_nom']
-            is_active = self.network.lines.loc[line_name, 'active']
-
-            # Convert to MVA (approximate with power factor 0.95)
-            flow_mva = flow_mw / 0.95 if flow_mw != 0 else 0
-
-            loading_pct = (flow_mva / s_nom * 100) if s_nom > 0 else 0
-            baseline_pct = self.baseline_loading.get(line_name, 0)
-            loading_change = loading_pct - baseline_pct
-
-            line_result = {
-                'name': line_name,
-                'bus0': self.network.lines.loc[line_name, 'bus0'],
-                'bus1': self.network.lines.loc[line_name, 'bus1'],
-                's_nom': float(s_nom),
-                'flow_mw': float(flow_mw),
-                'flow_mva': float(flow_mva),
-                'loading_pct': float(loading_pct),
-                'baseline_loading_pct': float(baseline_pct),
-                'loading_change_pct': float(loading_change),
-                'is_active': bool(is_active),
-                'is_outaged': line_name in outage_lines,
-                'status': 'outaged' if line_name in outage_lines else (
-                    'overloaded' if loading_pct >= 100 else
-                    'high_stress' if loading_pct >= 90 else
-                    'caution' if loading_pct >= 60 else
-                    'normal'
-                )
+        lines = self.network.lines
+        line_names = lines.index.tolist()
+        outage_set = set(outage_lines)
+
+        # Pull every column once and compute loading for all lines in NumPy
+        # (use the first/only snapshot)
+        flow_mw = np.abs(self._line_flow_row())
+        s_nom = lines['s_nom'].to_numpy(dtype=float)
+        is_active = lines['active'].to_numpy(dtype=bool)
+        is_outaged = np.zeros(len(line_names), dtype=bool)
+        is_outaged[[self._line_idx[name] for name in outage_set]] = True
+
+        # MVA flow (power factor 0.95), loading and status in one branchless pass
+        flow_mva, loading_pct, status_codes, _ = compute_line_stats(flow_mw, s_nom)
+        baseline_pct = self.baseline_loading_arr
+        loading_change = loading_pct - baseline_pct
+
+        status = np.where(is_outaged, 'outaged', LINE_STATUS_ARRAY[status_codes])
+
+        # Categorize active lines
+        in_service = is_active & ~is_outaged
+        overloaded = in_service & (loading_pct >= 100)
+        high_stress = in_service & (loading_pct >= 90) & ~overloaded
+        # Lines with significant loading change (>10%)
+        affected = in_service & (np.abs(loading_change) > 10)
+
+        # Per-line records, for every line or only those worth reporting
+        if detailed:
+            rows = np.arange(len(line_names))
+        else:
+            rows = np.flatnonzero((status != 'normal') | (np.abs(loading_change) > 10))
+            results['loading_summary_array'] = loading_pct
+        record_pos = np.full(len(line_names), -1)
+        record_pos[rows] = np.arange(len(rows))
+
+        loading_data = [
+            {
+                'name': name,
+                'bus0': bus0,
+                'bus1': bus1,
+                's_nom': s,
+                'flow_mw': mw,
+                'flow_mva': mva,
+                'loading_pct': pct,
+                'baseline_loading_pct': base,
+                'loading_change_pct': change,
+                'is_active': active,
+                'is_outaged': outaged,
+                'status': st
             }
+            for name, bus0, bus1, s, mw, mva, pct, base, change, active, outaged, st in zip(
+                [line_names[i] for i in rows],
+                lines['bus0'].to_numpy()[rows].tolist(),
+                lines['bus1'].to_numpy()[rows].tolist(),
+                s_nom[rows].tolist(),
+                flow_mw[rows].tolist(),
+                flow_mva[rows].tolist(),
+                loading_pct[rows].tolist(),
+                baseline_pct[rows].tolist(),
+                loading_change[rows].tolist(),
+                is_active[rows].tolist(),
+                is_outaged[rows].tolist(),
+                status[rows].tolist()
+            )
+        ]
 
-            loading_data.append(line_result)
-
-            # Categorize active lines
-            if is_active and line_name not in outage_lines:
-                if loading_pct >= 100:
-                    results['overloaded_lines'].append(line_result)
-                elif loading_pct >= 90:
-                    results['high_stress_lines'].append(line_result)
-
-                # Lines with significant loading change (>10%)
-                if abs(loading_change) > 10:
-                    results['affected_lines'].append(line_result)
+        results['overloaded_lines'] = [loading_data[record_pos[i]] for i in np.flatnonzero(overloaded)]
+        results['high_stress_lines'] = [loading_data[record_pos[i]] for i in np.flatnonzero(high_stress)]
+        results['affected_lines'] = [loading_data[record_pos[i]] for i in np.flatnonzero(affected)]
 
         results['loading_changes'] = loading_data
 
         # Check for islanded buses (disconnected from main grid)
-        results['islanded_buses'] = self._detect_islanded_buses(outage_lines)
+        if islanded_buses is None:
+            islanded_buses = self._detect_islanded_buses(outage_lines)
+        results['islanded_buses'] = islanded_buses
 
         # Calculate summary metrics
-        active_loading = [ld for ld in loading_data if ld['is_active'] and not ld['is_outaged']]
-        if active_loading:
-            loadings = [ld['loading_pct'] for ld in active_loading]
-            baseline_loadings = [ld['baseline_loading_pct'] for ld in active_loading]
+        if in_service.any():
+            loadings = loading_pct[in_service]
+            baseline_loadings = baseline_pct[in_service]
 
             results['metrics'] = {
                 'total_lines': len(self.network.lines),
                 'outaged_lines_count': len(outage_lines),
-                'active_lines_count': len(active_loading),
+                'active_lines_count': int(np.count_nonzero(in_service)),
                 'overloaded_count': len(results['overloaded_lines']),
                 'high_stress_count': len(results['high_stress_lines']),
                 'affected_lines_count': len(results['affected_lines']),
                 'islanded_buses_count': len(results['islanded_buses']),
-                'max_loading_pct': float(max(loadings)),
+                'max_loading_pct': float(loadings.max()),
                 'avg_loading_pct': float(np.mean(loadings)),
-                'max_loading_increase': float(max([ld['loading_change_pct'] for ld in active_loading], default=0)),
-                'baseline_max_loading': float(max(baseline_loadings)),
+                'max_loading_increase': float(loading_change[in_service].max()),
+                'baseline_max_loading': float(baseline_loadings.max()),
                 'baseline_avg_loading': float(np.mean(baseline_loadings)),
             }
         else:
@@ -350,40 +564,24 @@ class OutageSimulator:
         Returns:
             list: List of islanded bus information
         """
-        # Build connectivity graph of active lines
-        connected_buses = set()
-        bus_connections = {bus: set() for bus in self.network.buses.index}
-
-        # Add edges for active lines
-        for line_name, line in self.network.lines.iterrows():
-            if line['active']:
-                bus0 = line['bus0']
-                bus1 = line['bus1']
-                bus_connections[bus0].add(bus1)
-                bus_connections[bus1].add(bus0)
-
-        # Find connected components using BFS from a generator bus
-        if len(self.network.generators) > 0:
-            # Start from first generator bus
-            start_bus = self.network.generators.iloc[0]['bus']
-            visited = set()
-            queue = [start_bus]
-
-            while queue:
-                bus = queue.pop(0)
-                if bus in visited:
-                    continue
-                visited.add(bus)
-                connected_buses.add(bus)
-
-                # Add connected buses to queue
-                for neighbor in bus_connections.get(bus, []):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-
-        # Buses not in connected component are islanded
-        all_buses = set(self.network.buses.index)
-        islanded = all_buses - connected_buses
+        buses = self.network.buses.index
+
+        # Sparse connectivity graph of active lines and transformers (bus
+        # positions as nodes); transformers tie the 69 kV and 138 kV levels
+        bus0, bus1 = [], []
+        for branches in (self.network.lines, self.network.transformers):
+            active_mask = branches['active'].to_numpy(dtype=bool)
+            bus0.append(branches['bus0'].to_numpy()[active_mask])
+            bus1.append(branches['bus1'].to_numpy()[active_mask])
+        rows = buses.get_indexer(np.concatenate(bus0))
+        cols = buses.get_indexer(np.concatenate(bus1))
+        graph = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(buses), len(buses)))
+        _, labels = connected_components(graph, directed=False)
+
+        # Components containing a generator are energized; every other bus is islanded
+        gen_bus_pos = buses.get_indexer(self.network.generators['bus'].to_numpy())
+        live_labels = np.unique(labels[gen_bus_pos[gen_bus_pos >= 0]])
+        islanded = buses[~np.isin(labels, live_labels)].tolist()
 
         islanded_info = []
         for bus in islanded:
@@ -408,34 +606,118 @@ class OutageSimulator:
         if self.network is None:
             return []
 
-        lines = []
-        for line_name, line in self.network.lines.iterrows():
-            lines.append({
+        network_lines = self.network.lines
+        lines = [
+            {
                 'name': line_name,
-                'bus0': str(line['bus0']),
-                'bus1': str(line['bus1']),
-                's_nom': float(line['s_nom']),
-                'description': f"{line_name} | {line['bus0']} - {line['bus1']}"
-            })
+                'bus0': str(bus0),
+                'bus1': str(bus1),
+                's_nom': float(s_nom),
+                'description': f"{line_name} | {bus0} - {bus1}"
+            }
+            for line_name, bus0, bus1, s_nom in zip(
+                network_lines.index.tolist(),
+                network_lines['bus0'].tolist(),
+                network_lines['bus1'].tolist(),
+                network_lines['s_nom'].tolist()
+            )
+        ]
 
         return sorted(lines, key=lambda x: x['name'])
 
-    def run_multiple_contingency_scenarios(self, scenarios: List[List[str]]) -> List[Dict[str, Any]]:
+    def _run_scenarios(self, scenarios: List[List[str]], max_workers: int,
+                       use_lpf: bool, detailed: bool,
+                       pool: Optional[ProcessPoolExecutor] = None) -> List[Dict[str, Any]]:
         """
-        Run multiple N-1, N-2, etc. contingency scenarios.
+        Simulate each scenario, in a process pool when one is given or
+        max_workers > 1.
 
         Args:
             scenarios: List of outage scenarios, each containing list of line names
+            max_workers: Worker processes to use; 1 runs serially in this process.
+                Ignored when pool is given
+            use_lpf: Passed to simulate_outage()
+            detailed: Passed to simulate_outage()
+            pool: Long-lived pool from create_worker_pool(), reused as is
 
         Returns:
-            list: Results for each scenario
+            list: Results for each scenario, in order
         """
+        if pool is not None:
+            # ProcessPoolExecutor exposes its size only as _max_workers
+            max_workers = getattr(pool, '_max_workers', max_workers)
+        if pool is not None or max_workers > 1:
+            try:
+                logger.info(f"Running {len(scenarios)} scenarios on {max_workers} workers")
+                worker = partial(_simulate_outage_worker, use_lpf=use_lpf, detailed=detailed)
+                # Batch scenarios per task so large N-1 sweeps are not dominated by IPC
+                chunksize = max(1, len(scenarios) // (4 * max_workers))
+                if pool is not None:
+                    return list(pool.map(worker, scenarios, chunksize=chunksize))
+                with create_worker_pool(max_workers) as new_pool:
+                    return list(new_pool.map(worker, scenarios, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Parallel contingency run failed, running serially: {e}")
+
         results = []
         for i, outage_lines in enumerate(scenarios):
             logger.info(f"Running scenario {i+1}/{len(scenarios)}: {outage_lines}")
-            result = self.simulate_outage(outage_lines)
+            results.append(self.simulate_outage(outage_lines, use_lpf=use_lpf, detailed=detailed))
+        return results
+
+    def run_multiple_contingency_scenarios(self, scenarios: List[List[str]],
+                                           max_workers: int = 1,
+                                           detailed: bool = True,
+                                           use_lpf: bool = False,
+                                           refine_with_pf: bool = True,
+                                           pool: Optional[ProcessPoolExecutor] = None) -> List[Dict[str, Any]]:
+        """
+        Run multiple N-1, N-2, etc. contingency scenarios.
+
+        Scenarios are independent power flow solves. By default they run
+        serially in this process: a per-call pool reloads the network in every
+        worker, which costs more than it saves for typical batches, and forking
+        from the threaded Flask server is unsafe. Batch callers can pass a
+        long-lived pool from create_worker_pool(), or max_workers > 1 for a
+        pool that lives for this call only. With use_lpf every
+        scenario is screened with linear power flow and, if refine_with_pf is
+        set, only the stressed ones (max loading above PF_REFINE_LOADING_PCT)
+        are re-solved with AC power flow.
+
+        Args:
+            scenarios: List of outage scenarios, each containing list of line names
+            max_workers: Worker processes to use (default 1, serial in this
+                process); None uses min(scenarios, CPU count). Ignored when
+                pool is given
+            detailed: Passed to simulate_outage(); False keeps per-line records
+                only for outaged, stressed and affected lines
+            use_lpf: Screen scenarios with linear power flow
+            refine_with_pf: Re-run stressed linear-flow scenarios with AC power flow
+            pool: Long-lived pool from create_worker_pool() to run scenarios on
+
+        Returns:
+            list: Results for each scenario
+        """
+        if max_workers is None:
+            max_workers = min(len(scenarios), os.cpu_count() or 1)
+
+        results = self._run_scenarios(scenarios, max_workers, use_lpf, detailed, pool)
+
+        if use_lpf and refine_with_pf:
+            stressed = [
+                i for i, result in enumerate(results)
+                if result.get('success') and result['metrics']['max_loading_pct'] > PF_REFINE_LOADING_PCT
+            ]
+            if stressed:
+                logger.info(f"Refining {len(stressed)} stressed scenarios with AC power flow")
+                refined = self._run_scenarios(
+                    [scenarios[i] for i in stressed], min(max_workers, len(stressed)), False, detailed, pool
+                )
+                for i, result in zip(stressed, refined):
+                    results[i] = result
+
+        for i, (outage_lines, result) in enumerate(zip(scenarios, results)):
             result['scenario_id'] = i + 1
             result['scenario_type'] = f"N-{len(outage_lines)}"
-            results.append(result)
 
         return results
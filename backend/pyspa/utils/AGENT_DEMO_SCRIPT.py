@@ -9,6 +9,9 @@ from datetime import datetime
 # Base URL for API
 BASE_URL = "http://localhost:5000/api"
 
+# One session for the whole demo so every call reuses the same keep-alive connection
+SESSION = requests.Session()
+
 def print_section(title):
     """Print a formatted section header"""
     print("\n" + "=" * 70)
@@ -19,7 +22,7 @@ def demo_agent_status():
     """Demonstrate agent status endpoint"""
     print_section("1. AGENT STATUS - Getting Agent State")
 
-    response = requests.get(f"{BASE_URL}/agent/status")
+    response = SESSION.get(f"{BASE_URL}/agent/status")
 
     if response.status_code == 200:
         data = response.json()
@@ -56,7 +59,7 @@ def demo_monitoring():
     print(f"    Wind Speed: {weather['wind_speed']} ft/sec")
     print(f"    Time: {weather['sun_time']}:00")
 
-    response = requests.post(f"{BASE_URL}/agent/monitor", json={"weather": weather})
+    response = SESSION.post(f"{BASE_URL}/agent/monitor", json={"weather": weather})
 
     if response.status_code == 200:
         data = response.json()
@@ -95,7 +98,7 @@ def demo_predictions():
     for i, w in enumerate(forecast, 1):
         print(f"    Hour {i}: {w['ambient_temp']}°C, {w['wind_speed']} ft/s wind")
 
-    response = requests.post(f"{BASE_URL}/agent/predictions", json={"weather_forecast": forecast})
+    response = SESSION.post(f"{BASE_URL}/agent/predictions", json={"weather_forecast": forecast})
 
     if response.status_code == 200:
         data = response.json()
@@ -141,7 +144,7 @@ def demo_recommendations():
         "date": "12 Jun"
     }
 
-    response = requests.post(f"{BASE_URL}/agent/recommendations", json={"weather": weather})
+    response = SESSION.post(f"{BASE_URL}/agent/recommendations", json={"weather": weather})
 
     if response.status_code == 200:
         data = response.json()
@@ -197,7 +200,7 @@ def demo_learning():
     print(f"    Outcome: {action_data['result']['outcome']}")
     print(f"    Impact Score: {action_data['result']['impact_score']}")
 
-    response = requests.post(f"{BASE_URL}/agent/learn", json=action_data)
+    response = SESSION.post(f"{BASE_URL}/agent/learn", json=action_data)
 
     if response.status_code == 200:
         data = response.json()
@@ -224,7 +227,7 @@ def demo_chatbot_with_insights():
 
     print(f"\n  User Query: \"{message}\"")
 
-    response = requests.post(
+    response = SESSION.post(
         f"{BASE_URL}/chatbot",
         json={"message": message, "weather": weather}
     )
@@ -5,31 +5,136 @@ Note: This version uses static MVA ratings from conductor_ratings.csv.
 For true dynamic IEEE 738 calculations, a detailed conductor library with
 resistance and diameter parameters would be needed.
 """
-import pandas as pd
 import numpy as np
+import pandas as pd
 import logging
 import math
+import traceback
+from functools import lru_cache
+
+from config import AppConfig
+from rating_kernels import steady_state_thermal_ratings
+
+# IEEE738 engine is optional; fall back to static ratings when it cannot be imported
+try:
+    from ieee738_integration import IEEE738RatingEngine
+except Exception:
+    IEEE738RatingEngine = None
 
 logger = logging.getLogger(__name__)
 
+# Loading thresholds (percent of rating) and the stress level at or above each
+CRITICAL_LOADING_PCT = AppConfig.STRESS_THRESHOLD_CRITICAL
+HIGH_LOADING_PCT = AppConfig.STRESS_THRESHOLD_HIGH
+CAUTION_LOADING_PCT = AppConfig.STRESS_THRESHOLD_CAUTION
+STRESS_LEVELS = ('critical', 'high', 'caution')
+
+# Search modes accepted by RatingCalculator.find_overload_threshold
+THRESHOLD_MODES = ('sweep', 'bisect')
+
+# MVA = sqrt(3) * amps * kV / 1000
+_SQRT3 = math.sqrt(3.0)
+
+# Weather used for any parameter a request leaves out
+_DEFAULT_WEATHER = AppConfig.get_default_weather_params()
+
+
+def _classify_stress(loading_pct):
+    """
+    Stress level of each loading percentage
+
+    Args:
+        loading_pct: Loading percentage, scalar or array
+
+    Returns:
+        np.ndarray: 'critical', 'high', 'caution' or 'normal' per element
+    """
+    loading_pct = np.asarray(loading_pct)
+    return np.select(
+        [loading_pct >= CRITICAL_LOADING_PCT,
+         loading_pct >= HIGH_LOADING_PCT,
+         loading_pct >= CAUTION_LOADING_PCT],
+        STRESS_LEVELS,
+        default='normal'
+    )
+
+
+@lru_cache(maxsize=None)
+def _warn_missing_conductor(conductor_name):
+    """Warn once per conductor missing from the ratings table, not once per line."""
+    logger.warning(f"Conductor '{conductor_name}' not found; lines using it cannot be rated")
+
 
 class RatingCalculator:
     def __init__(self, data_loader):
         self.data_loader = data_loader
-        # IEEE738 engine will be imported lazily to avoid hard dependency issues
-        try:
-            from ieee738_integration import IEEE738RatingEngine
-            self._ieee_engine_cls = IEEE738RatingEngine
-        except Exception:
-            self._ieee_engine_cls = None
+        self._ieee_engine_cls = IEEE738RatingEngine
+        # (merged weather, engine) of the last IEEE engine built, see _get_ieee_engine
+        self._engine_cache = None
+        # Memoized data loader lookups and per-line parameter arrays, dropped
+        # when the loader reloads its data (see _sync_caches)
+        self._cond_cache = {}
+        self._volt_cache = {}
+        self._param_arrays = None
+        self._cache_source = None
+
+    def clear_caches(self):
+        """Drop memoized data loader lookups and parameter arrays."""
+        self._cond_cache.clear()
+        self._volt_cache.clear()
+        self._param_arrays = None
+        self._engine_cache = None
+
+    def _sync_caches(self):
+        """Clear the caches if the data loader has replaced its lines table."""
+        source = self.data_loader.lines_df
+        if source is not self._cache_source:
+            self.clear_caches()
+            self._cache_source = source
+
+    def _get_bus_voltage(self, bus_name):
+        """Memoized data_loader.get_bus_voltage()."""
+        if bus_name not in self._volt_cache:
+            self._volt_cache[bus_name] = self.data_loader.get_bus_voltage(bus_name)
+        return self._volt_cache[bus_name]
+
+    def _get_conductor_params(self, conductor_name):
+        """Memoized data_loader.get_conductor_params()."""
+        if conductor_name not in self._cond_cache:
+            self._cond_cache[conductor_name] = self.data_loader.get_conductor_params(conductor_name)
+        return self._cond_cache[conductor_name]
+
+    @staticmethod
+    def _merge_weather(weather_params):
+        """Default weather parameters overridden by the request's values."""
+        return {**_DEFAULT_WEATHER, **(weather_params or {})}
+
+    def _get_ieee_engine(self, merged_weather):
+        """
+        IEEE-738 engine for the given weather, reused while the weather is unchanged
+
+        Args:
+            merged_weather: Complete weather parameters (see _merge_weather)
+
+        Returns:
+            IEEE738RatingEngine, or None if the engine is unavailable
+        """
+        if self._ieee_engine_cls is None:
+            return None
+        if self._engine_cache is None or self._engine_cache[0] != merged_weather:
+            engine = self._ieee_engine_cls(loader=self.data_loader, ambient_defaults=merged_weather)
+            self._engine_cache = (dict(merged_weather), engine)
+        return self._engine_cache[1]
 
-    def calculate_line_rating(self, line_data, weather_params):
+    def calculate_line_rating(self, line_data, weather_params, engine=None):
         """
         Calculate rating for a single line using static conductor ratings
 
         Args:
             line_data: Dictionary with line information
             weather_params: Dictionary with weather conditions (currently not used for static ratings)
+            engine: IEEE738RatingEngine built for weather_params; the cached
+                engine for that weather is used if omitted
 
         Returns:
             Dictionary with rating information
@@ -39,23 +144,22 @@ class RatingCalculator:
         rating_mva = None
 
         try:
-            voltage_kv = self.data_loader.get_bus_voltage(line_data['bus0_name'])
+            self._sync_caches()
+            voltage_kv = self._get_bus_voltage(line_data['bus0_name'])
             if voltage_kv is None:
                 logger.warning(f"Line {line_data['name']}: Bus voltage for '{line_data['bus0_name']}' not found")
                 return None
 
             # Try IEEE engine
             try:
-                if self._ieee_engine_cls is not None:
-                    # Merge defaults and per-request weather to ensure all keys present
-                    from config import AppConfig
-                    merged_weather = {**AppConfig.get_default_weather_params(), **(weather_params or {})}
-                    engine = self._ieee_engine_cls(loader=self.data_loader, ambient_defaults=merged_weather)
+                if engine is None:
+                    engine = self._get_ieee_engine(self._merge_weather(weather_params))
+                if engine is not None:
                     ieee_result = engine.compute_line_rating(line_data)
                     if ieee_result and ieee_result.get('rating_amps') is not None:
                         rating_amps = float(ieee_result['rating_amps'])
                         # Compute MVA at the line's nominal voltage
-                        rating_mva = (math.sqrt(3) * rating_amps * voltage_kv * 1000.0) / 1e6
+                        rating_mva = _SQRT3 * rating_amps * voltage_kv * 1e-3
                     else:
                         logger.debug(f"IEEE engine did not return rating for line {line_data['name']}: {ieee_result.get('error') if ieee_result else 'no result'}")
             except Exception as e:
@@ -65,9 +169,10 @@ class RatingCalculator:
 
             # If IEEE dynamic rating not available, fall back to static conductor ratings
             if rating_amps is None:
-                conductor_params = self.data_loader.get_conductor_params(line_data['conductor'])
+                conductor_params = self._get_conductor_params(line_data['conductor'])
                 if conductor_params is None:
-                    logger.warning(f"Line {line_data['name']}: Conductor '{line_data['conductor']}' not found")
+                    logger.debug(f"Line {line_data['name']}: Conductor '{line_data['conductor']}' not found")
+                    _warn_missing_conductor(line_data['conductor'])
                     return None
 
                 if voltage_kv == 138.0:
@@ -85,20 +190,12 @@ class RatingCalculator:
             # Get nominal flow (in MW, convert to MVA)
             flow_mw = self.data_loader.get_line_flow(line_data['name'])
             # Approximate MVA assuming power factor of 0.95
-            flow_mva = abs(flow_mw) / 0.95 if flow_mw != 0 else 0
+            flow_mva = abs(flow_mw) / 0.95
 
             # Calculate loading percentage
             loading_pct = (flow_mva / rating_mva * 100) if rating_mva > 0 else 0
 
-            # Determine stress level
-            if loading_pct >= 100:
-                stress_level = 'critical'
-            elif loading_pct >= 90:
-                stress_level = 'high'
-            elif loading_pct >= 60:
-                stress_level = 'caution'
-            else:
-                stress_level = 'normal'
+            stress_level = _classify_stress(loading_pct).item()
 
             return {
                 'name': line_data['name'],
@@ -117,68 +214,347 @@ class RatingCalculator:
                 'bus1': line_data.get('bus1_name')
             }
 
-        except Exception as e:
-            import traceback
-            logger.error(f"Error calculating rating for {line_data.get('name')}: {str(e)}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error calculating rating for %s", line_data.get('name'))
             return None
 
-    def calculate_all_line_ratings(self, weather_params):
+    def _build_param_arrays(self):
         """
-        Calculate ratings for all lines
+        Gather the static per-line inputs of the rating calculation into arrays
 
-        Args:
-            weather_params: Weather parameters (currently not used for static ratings)
+        Conductor properties come from the IEEE-738 conductor library (NaN where
+        a conductor is missing) and the static fallback ratings from the
+        conductor ratings table. The result is cached until the data loader
+        reloads its data or clear_caches() is called.
 
         Returns:
-            Dictionary with 'lines' and 'summary' keys
+            dict: Line records and aligned numpy arrays
         """
+        self._sync_caches()
+        if self._param_arrays is not None:
+            return self._param_arrays
+
         lines = self.data_loader.get_all_lines()
-        results = []
-        failed_count = 0
+        if not lines:
+            lines_df = pd.DataFrame(columns=['name', 'bus0_name', 'conductor', 'MOT'])
+        else:
+            lines_df = self.data_loader.lines_df
+        # Integer code per line into the distinct conductor names (-1 if missing)
+        conductor_codes, conductor_names = pd.factorize(lines_df['conductor'])
+
+        def lookup(line_column, table, key, column):
+            """Map a line column through the first matching row of a loader table."""
+            if table is None or table.empty:
+                return np.full(len(lines_df), np.nan)
+            series = table.drop_duplicates(key).set_index(key)[column]
+            return lines_df[line_column].map(series).to_numpy(dtype=float)
+
+        def conductor_columns(table, columns):
+            """Per-line values of conductor table columns, indexed by conductor code."""
+            matrix = np.full((len(conductor_names) + 1, len(columns)), np.nan)
+            if table is not None and not table.empty:
+                matrix[:-1] = (
+                    table.drop_duplicates('ConductorName').set_index('ConductorName')
+                    .reindex(conductor_names)[columns].to_numpy(dtype=float)
+                )
+            # Code -1 selects the trailing all-NaN row
+            return matrix[conductor_codes].T
+
+        voltage_kv = lookup('bus0_name', self.data_loader.buses_df, 'BusName', 'v_nom')
+        missing = np.isnan(voltage_kv)
+        for i in np.flatnonzero(missing):
+            logger.warning(f"Line {lines[i]['name']}: Bus voltage for '{lines[i]['bus0_name']}' not found")
+
+        flow_mw = np.nan_to_num(lookup('name', self.data_loader.flows_df, 'name', 'p0_nominal'))
+        flow_mw[missing] = 0.0
+        mot = pd.to_numeric(lines_df['MOT'], errors='coerce').to_numpy(dtype=float)
+
+        # First matching row of the static ratings table, as get_conductor_params() returns
+        static_amps, rating_69, rating_138 = conductor_columns(
+            self.data_loader.conductors_df, ['RatingAmps', 'RatingMVA_69', 'RatingMVA_138']
+        )
+        static_mva = np.where(voltage_kv == 69.0, rating_69, rating_138)
+        static_amps[missing] = np.nan
+        static_mva[missing] = np.nan
+
+        # IEEE-738 conductor properties, converted to ohms/ft and diameter in inches
+        library = None
+        if self._ieee_engine_cls is not None:
+            try:
+                engine = self._get_ieee_engine(self._merge_weather(None))
+                library = engine.get_conductor_library()
+            except Exception as e:
+                logger.warning(f"IEEE conductor library unavailable, using static ratings: {e}")
+        res_25c, res_50c, radius = conductor_columns(library, ['RES_25C', 'RES_50C', 'CDRAD_in'])
+        RLo = res_25c / 5280.0
+        RHi = res_50c / 5280.0
+        Diameter = radius * 2.0
+
+        self._param_arrays = {
+            'lines': lines,
+            'voltage_kv': voltage_kv,
+            'flow_mw': flow_mw,
+            'RLo': RLo,
+            'RHi': RHi,
+            'Diameter': Diameter,
+            'MOT': mot,
+            'static_rating_mva': static_mva,
+            'static_rating_amps': static_amps,
+        }
+        return self._param_arrays
+
+    def _dynamic_ratings_amps(self, params, weather_params, ambient_temps=None):
+        """
+        IEEE-738 ratings in amps for every line, NaN where unavailable
 
-        for line in lines:
-            rating = self.calculate_line_rating(line, weather_params)
-            if rating is not None:
-                results.append(rating)
+        Args:
+            params: Arrays from _build_param_arrays()
+            weather_params: Weather conditions merged over the defaults
+            ambient_temps: Optional 1-D array of ambient temperatures to
+                evaluate at once in place of weather_params['Ta']
+
+        Returns:
+            np.ndarray: Ratings in amps, shape (len(ambient_temps), n) when
+            ambient_temps is given
+        """
+        n = len(params['lines'])
+        shape = n if ambient_temps is None else (len(ambient_temps), n)
+        if self._ieee_engine_cls is None:
+            return np.full(shape, np.nan)
+
+        # Missing MOT falls back to ambient, then clamps to 50-100 degC as the engine does
+        mot = params['MOT']
+        missing_mot = np.isnan(mot)
+        if missing_mot.any():
+            if ambient_temps is None:
+                logger.warning(f"{int(missing_mot.sum())} lines missing MOT, using ambient Ta default: {weather_params.get('Ta')}")
+                mot = np.where(missing_mot, float(weather_params.get('Ta', 75.0)), mot)
             else:
-                failed_count += 1
+                logger.warning(f"{int(missing_mot.sum())} lines missing MOT, using ambient Ta default")
+                mot = np.where(missing_mot, np.asarray(ambient_temps, dtype=np.float64)[:, None], mot)
+        mot = np.clip(mot, 50.0, 100.0)
 
-        if failed_count > 0:
-            logger.warning(f"{failed_count} out of {len(lines)} lines failed to calculate")
+        try:
+            return steady_state_thermal_ratings(
+                weather_params, params['Diameter'], params['RLo'], params['RHi'], mot,
+                ambient_temps=ambient_temps
+            )
+        except Exception as e:
+            logger.warning(f"IEEE rating engine failed for all lines: {e}")
+            return np.full(shape, np.nan)
+
+    def _ratings_from_arrays(self, params, weather_params, ambient_temps=None):
+        """
+        Ratings and loadings for every line under one weather state
+
+        Dynamic IEEE-738 ratings are computed for every line at once; lines
+        without a usable dynamic rating fall back to the static conductor
+        rating, as in calculate_line_rating().
+
+        Args:
+            params: Arrays from _build_param_arrays()
+            weather_params: Weather conditions merged over the defaults
+            ambient_temps: Optional 1-D array of ambient temperatures; the
+                per-line arrays then gain a leading temperature axis
+
+        Returns:
+            dict: Arrays rating_amps, rating_mva, flow_mva, loading_pct and the
+            boolean mask 'valid' of lines that could be rated
+        """
+        voltage_kv = params['voltage_kv']
+
+        rating_amps = self._dynamic_ratings_amps(params, weather_params, ambient_temps)
+        rating_mva = _SQRT3 * rating_amps * voltage_kv * 1e-3
+
+        static = np.isnan(rating_amps)
+        rating_amps = np.where(static, params['static_rating_amps'], rating_amps)
+        rating_mva = np.where(static, params['static_rating_mva'], rating_mva)
+
+        unusual = static & ~np.isnan(rating_mva) & (voltage_kv != 138.0) & (voltage_kv != 69.0)
+        for i in np.flatnonzero(np.atleast_2d(unusual).any(axis=0)):
+            logger.warning(f"Line {params['lines'][i]['name']}: Unusual voltage {voltage_kv[i]} kV, using 138kV rating")
+
+        flow_mva = np.abs(params['flow_mw']) / 0.95
+        with np.errstate(invalid='ignore', divide='ignore'):
+            loading_pct = np.where(rating_mva > 0, flow_mva / rating_mva * 100, 0.0)
+
+        return {
+            'rating_amps': rating_amps,
+            'rating_mva': rating_mva,
+            'flow_mva': flow_mva,
+            'loading_pct': loading_pct,
+            'valid': ~np.isnan(voltage_kv) & ~np.isnan(rating_mva),
+        }
+
+    @staticmethod
+    def _loading_summary(loading):
+        """
+        Threshold counts, mean and max of rounded line loadings
 
-        # Calculate summary statistics
-        if len(results) == 0:
-            summary = {
-                'total_lines': 0,
+        Args:
+            loading: 1-D array of loading percentages (rounded to 2 places)
+
+        Returns:
+            dict: overloaded_lines, high_stress_lines, caution_lines,
+            avg_loading and max_loading
+        """
+        if len(loading) == 0:
+            return {
                 'overloaded_lines': 0,
                 'high_stress_lines': 0,
                 'caution_lines': 0,
                 'avg_loading': 0,
-                'max_loading': 0,
-                'critical_lines': []
+                'max_loading': 0
             }
-        else:
-            df = pd.DataFrame(results)
-
-            summary = {
-                'total_lines': len(results),
-                'overloaded_lines': len(df[df['loading_pct'] >= 100]),
-                'high_stress_lines': len(df[df['loading_pct'] >= 90]),
-                'caution_lines': len(df[df['loading_pct'] >= 60]),
-                'avg_loading': round(df['loading_pct'].mean(), 2),
-                'max_loading': round(df['loading_pct'].max(), 2),
-                'critical_lines': df.nlargest(10, 'loading_pct')[
-                    ['name', 'branch_name', 'loading_pct', 'margin_mva']
-                ].to_dict('records')
+        return {
+            'overloaded_lines': int(np.count_nonzero(loading >= CRITICAL_LOADING_PCT)),
+            'high_stress_lines': int(np.count_nonzero(loading >= HIGH_LOADING_PCT)),
+            'caution_lines': int(np.count_nonzero(loading >= CAUTION_LOADING_PCT)),
+            'avg_loading': round(float(loading.mean()), 2),
+            'max_loading': round(float(loading.max()), 2),
+        }
+
+    def calculate_all_line_ratings(self, weather_params):
+        """
+        Calculate ratings for all lines
+
+        Args:
+            weather_params: Weather parameters
+
+        Returns:
+            Dictionary with 'lines' and 'summary' keys
+        """
+        merged_weather = self._merge_weather(weather_params)
+
+        params = self._build_param_arrays()
+        lines = params['lines']
+        rated = self._ratings_from_arrays(params, merged_weather)
+        voltage_kv = params['voltage_kv']
+        rating_mva = rated['rating_mva']
+        loading_pct = rated['loading_pct']
+        stress_level = _classify_stress(loading_pct)
+
+        # Lines without a rating are reported, then dropped before building records
+        valid = rated['valid']
+        for i in np.flatnonzero(~valid & ~np.isnan(voltage_kv)).tolist():
+            logger.debug(f"Line {lines[i]['name']}: Conductor '{lines[i]['conductor']}' not found")
+            _warn_missing_conductor(lines[i]['conductor'])
+        failed_count = len(lines) - int(np.count_nonzero(valid))
+
+        columns = zip(
+            [lines[i] for i in np.flatnonzero(valid).tolist()],
+            voltage_kv[valid].tolist(), rated['rating_amps'][valid].tolist(),
+            rating_mva[valid].tolist(), rated['flow_mva'][valid].tolist(), loading_pct[valid].tolist(),
+            stress_level[valid].tolist()
+        )
+        results = [
+            {
+                'name': line['name'],
+                'branch_name': line.get('branch_name'),
+                'conductor': line['conductor'],
+                'MOT': line.get('MOT'),
+                'voltage_kv': voltage,
+                'rating_amps': round(amps, 2),
+                'rating_mva': round(mva, 2),
+                'static_rating_mva': line.get('s_nom'),
+                'flow_mva': round(f_mva, 2),
+                'loading_pct': round(pct, 2) if mva > 0 else 0,
+                'margin_mva': round(mva - f_mva, 2),
+                'stress_level': stress,
+                'bus0': line.get('bus0_name'),
+                'bus1': line.get('bus1_name')
             }
+            for line, voltage, amps, mva, f_mva, pct, stress in columns
+        ]
+
+        if failed_count > 0:
+            logger.warning(f"{failed_count} out of {len(lines)} lines failed to calculate")
+
+        # Calculate summary statistics; the stable sort keeps file order among equal loadings
+        loading = np.fromiter((r['loading_pct'] for r in results), dtype=np.float64, count=len(results))
+        top = np.argsort(-loading, kind='stable')[:10]
+        summary = {
+            'total_lines': len(results),
+            **self._loading_summary(loading),
+            'critical_lines': [
+                {key: results[i][key] for key in ('name', 'branch_name', 'loading_pct', 'margin_mva')}
+                for i in top.tolist()
+            ]
+        }
 
         return {
             'lines': results,
             'summary': summary
         }
 
-    def find_overload_threshold(self, temp_start, temp_end, wind_speed, step=1):
+    def _threshold_progression(self, params, base_weather, temps):
+        """
+        Overload summary at each ambient temperature
+
+        Args:
+            params: Arrays from _build_param_arrays()
+            base_weather: Weather parameters other than Ta
+            temps: 1-D array of ambient temperatures (Celsius)
+
+        Returns:
+            list: One progression entry per temperature
+        """
+        results = []
+
+        # Every temperature in one broadcast heat balance, shape (temps, lines)
+        rated = self._ratings_from_arrays(params, base_weather, ambient_temps=temps)
+        for temp, loading_pct, valid in zip(temps.tolist(), rated['loading_pct'], rated['valid']):
+            row = loading_pct[valid].tolist()
+            loading = np.fromiter((round(p, 2) for p in row), dtype=np.float64, count=len(row))
+            summary = self._loading_summary(loading)
+
+            results.append({
+                'temperature': temp,
+                'overloaded_lines': summary['overloaded_lines'],
+                'high_stress_lines': summary['high_stress_lines'],
+                'avg_loading': summary['avg_loading'],
+                'max_loading': summary['max_loading']
+            })
+
+        return results
+
+    def _bisect_progression(self, params, base_weather, temps):
+        """
+        Overload summaries at the temperatures a bisection for the first overload visits
+
+        Line loading rises with ambient temperature, so the overloaded line
+        count is non-decreasing along temps (while ambient stays below the
+        conductors' MOT) and the first overloaded temperature is found in
+        O(log n) evaluations.
+
+        Args:
+            params: Arrays from _build_param_arrays()
+            base_weather: Weather parameters other than Ta
+            temps: 1-D array of ambient temperatures (Celsius), ascending
+
+        Returns:
+            list: Progression entries of the evaluated temperatures, in order
+        """
+        evaluated = {}
+
+        def overloaded(i):
+            if i not in evaluated:
+                evaluated[i] = self._threshold_progression(params, base_weather, temps[i:i + 1])[0]
+            return evaluated[i]['overloaded_lines'] > 0
+
+        lo, hi = 0, len(temps) - 1
+        if hi >= 0 and not overloaded(lo) and overloaded(hi):
+            # Invariant: temps[lo] has no overloads, temps[hi] has some
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if overloaded(mid):
+                    hi = mid
+                else:
+                    lo = mid
+
+        return [evaluated[i] for i in sorted(evaluated)]
+
+    def find_overload_threshold(self, temp_start, temp_end, wind_speed, step=1, mode='sweep'):
         """
         Find the temperature threshold where lines start to overload
 
@@ -187,37 +563,35 @@ class RatingCalculator:
             temp_end: Ending temperature (Celsius)
             wind_speed: Wind speed (ft/sec)
             step: Temperature increment
+            mode: 'sweep' reports every temperature; 'bisect' only locates the
+                first overload temperature and reports the temperatures visited
 
         Returns:
             Dictionary with threshold information
         """
+        if mode not in THRESHOLD_MODES:
+            raise ValueError(f"Unknown threshold mode '{mode}', expected 'sweep' or 'bisect'")
         temps = np.arange(temp_start, temp_end + step, step)
-        results = []
 
-        for temp in temps:
-            weather_params = {
-                'Ta': temp,
-                'WindVelocity': wind_speed,
-                'WindAngleDeg': 90,
-                'SunTime': 12,
-                'Date': '12 Jun',
-                'Emissivity': 0.8,
-                'Absorptivity': 0.8,
-                'Direction': 'EastWest',
-                'Atmosphere': 'Clear',
-                'Elevation': 1000,
-                'Latitude': 27
-            }
-
-            ratings_result = self.calculate_all_line_ratings(weather_params)
+        # Line parameters and the weather are fixed across the sweep; only Ta varies
+        params = self._build_param_arrays()
+        base_weather = {
+            'WindVelocity': wind_speed,
+            'WindAngleDeg': 90,
+            'SunTime': 12,
+            'Date': '12 Jun',
+            'Emissivity': 0.8,
+            'Absorptivity': 0.8,
+            'Direction': 'EastWest',
+            'Atmosphere': 'Clear',
+            'Elevation': 1000,
+            'Latitude': 27
+        }
 
-            results.append({
-                'temperature': temp,
-                'overloaded_lines': ratings_result['summary']['overloaded_lines'],
-                'high_stress_lines': ratings_result['summary']['high_stress_lines'],
-                'avg_loading': ratings_result['summary']['avg_loading'],
-                'max_loading': ratings_result['summary']['max_loading']
-            })
+        if mode == 'bisect':
+            results = self._bisect_progression(params, base_weather, temps)
+        else:
+            results = self._threshold_progression(params, base_weather, temps)
 
         # Find first temperature where overloads occur
         first_overload_temp = None
@@ -268,8 +642,7 @@ class RatingCalculator:
                 'outage_lines': outage_lines
             }
         except Exception as e:
-            logger.error(f"Contingency analysis failed: {e}")
-            import traceback
+            logger.exception("Contingency analysis failed")
             return {
                 'success': False,
                 'error': str(e),
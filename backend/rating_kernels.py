@@ -0,0 +1,218 @@
+"""
+Vectorized IEEE-738 steady-state thermal rating
+
+Evaluates the same heat balance as ``ieee738.Conductor`` for many conductors
+at once under a single weather state. The solar position terms depend only on
+the weather and are computed once; the convection, radiation and resistance
+terms are evaluated per line. When numba is installed that per-line loop is
+JIT-compiled (and cached on disk); otherwise it runs on NumPy arrays.
+"""
+import math
+import logging
+
+import numpy as np
+
+import ieee738
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Resistance reference temperatures used by the conductor library (deg C)
+T_LO = 25.0
+T_HI = 50.0
+
+# Thermal conductivity of air polynomial (ieee738.Conductor.get_kf)
+KF_COEFFS = (7.388e-3, 2.279e-5, -1.343e-9)
+
+# Upper bound on conductor resistance accepted by ieee738 (ohms/ft)
+MAX_RESISTANCE_PER_FT = 0.001
+
+
+def _solar_terms(conductor):
+    """
+    Weather-only solar terms of ``Conductor.solar_heat_gain``.
+
+    Args:
+        conductor: ieee738.Conductor built from the weather parameters
+
+    Returns:
+        tuple: (Qs, sin_theta) where qs = a * Qs * sin_theta * D/12 * Ke
+    """
+    Hc = conductor.get_hc()
+    Qs = conductor.get_Qs(Hc)
+    Zc = conductor.get_zc()
+    z1 = 0.0 if conductor.Direction == 'NorthSouth' else 90.0
+    e1 = math.cos(ieee738.deg2rad(Hc)) * math.cos(ieee738.deg2rad(Zc - z1))
+    return Qs, math.sin(math.acos(e1))
+
+
+def _air_properties(Tc, Ta, elevation):
+    """Air density, viscosity and conductivity at the film temperature."""
+    Tfilm = (Tc + Ta) / 2.0
+    pf = (0.080695 - 2.901e-6 * elevation + 3.7e-11 * elevation ** 2) / (1 + 0.00367 * Tfilm)
+    uf = (0.00353 * (Tfilm + 273.0) ** 1.5) / (Tfilm + 383.4)
+    kf = KF_COEFFS[2] * Tfilm ** 2 + KF_COEFFS[1] * Tfilm + KF_COEFFS[0]
+    return pf, uf, kf
+
+
+def _heat_balance_numpy(Ta, He, Vwind, Kangle, solar, Kelev, emissivity, Diameter, RLo, RHi, Tc):
+    Ta = Ta[:, None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Natural convection (density taken before Tc is raised above Ta)
+        pf, _, _ = _air_properties(Tc, Ta, He)
+        Tc = np.where(Tc - Ta < 0, Ta + 0.1, Tc)
+        qcn = 0.283 * pf ** 0.5 * Diameter ** 0.75 * (Tc - Ta) ** 1.25
+
+        # Forced convection
+        pf, uf, kf = _air_properties(Tc, Ta, He)
+        qc1 = (1.01 + 0.371 * ((Diameter * pf * Vwind) / uf) ** 0.52) * kf * (Tc - Ta)
+        qc2 = 0.1695 * (Diameter * pf * Vwind / uf) ** 0.6 * kf * (Tc - Ta)
+        qc = np.maximum(qcn, np.maximum(qc1 * Kangle, qc2 * Kangle))
+
+        # Solar gain and radiated loss
+        qs = solar * (Diameter / 12.0) * Kelev
+        qr = 0.138 * Diameter * emissivity * \
+            (((Tc + 273.0) / 100.0) ** 4 - ((Ta + 273.0) / 100.0) ** 4)
+
+        rTc = RLo + ((RHi - RLo) / (T_HI - T_LO)) * (Tc - T_LO)
+
+        net = qc + qr - qs
+        amps = np.where(net < 0, 0.0, np.sqrt(net / rTc))
+
+    # ieee738 rejects a zero radiated loss, which happens exactly when Tc == Ta
+    invalid = (
+        (RLo > MAX_RESISTANCE_PER_FT) | (RHi > MAX_RESISTANCE_PER_FT)
+        | (qs == 0) | (qr == 0) | (Tc == Ta) | ~np.isfinite(amps)
+    )
+    return np.where(invalid, np.nan, amps)
+
+
+def _heat_balance_loop(Ta, He, Vwind, Kangle, solar, Kelev, emissivity, Diameter, RLo, RHi, Tc):
+    n_temps, n = Tc.shape
+    amps = np.empty((n_temps, n))
+    density = 0.080695 - 2.901e-6 * He + 3.7e-11 * He ** 2
+    D_075 = Diameter ** 0.75
+
+    for t in range(n_temps):
+        ta = Ta[t]
+        ta_rad = ((ta + 273.0) / 100.0) ** 4
+        for i in range(n):
+            D = Diameter[i]
+            tc = Tc[t, i]
+
+            # Natural convection (density taken before Tc is raised above Ta)
+            pf = density / (1 + 0.00367 * ((tc + ta) / 2.0))
+            if tc - ta < 0:
+                tc = ta + 0.1
+            qcn = 0.283 * math.sqrt(pf) * D_075[i] * (tc - ta) ** 1.25
+
+            # Forced convection
+            Tfilm = (tc + ta) / 2.0
+            pf = density / (1 + 0.00367 * Tfilm)
+            uf = (0.00353 * (Tfilm + 273.0) ** 1.5) / (Tfilm + 383.4)
+            kf = KF_COEFFS[2] * Tfilm ** 2 + KF_COEFFS[1] * Tfilm + KF_COEFFS[0]
+            qc1 = (1.01 + 0.371 * ((D * pf * Vwind) / uf) ** 0.52) * kf * (tc - ta)
+            qc2 = 0.1695 * (D * pf * Vwind / uf) ** 0.6 * kf * (tc - ta)
+            qc = max(qcn, max(qc1 * Kangle, qc2 * Kangle))
+            if math.isnan(qcn) or math.isnan(qc1) or math.isnan(qc2):
+                qc = np.nan
+
+            # Solar gain and radiated loss
+            qs = solar * (D / 12.0) * Kelev
+            qr = 0.138 * D * emissivity * \
+                (((tc + 273.0) / 100.0) ** 4 - ta_rad)
+
+            rTc = RLo[i] + ((RHi[i] - RLo[i]) / (T_HI - T_LO)) * (tc - T_LO)
+
+            net = qc + qr - qs
+            if net < 0:
+                rating = 0.0
+            elif rTc == 0:
+                rating = np.nan
+            else:
+                rating = math.sqrt(net / rTc) if net / rTc >= 0 else np.nan
+
+            if (RLo[i] > MAX_RESISTANCE_PER_FT or RHi[i] > MAX_RESISTANCE_PER_FT
+                    or qs == 0 or qr == 0 or tc == ta or not math.isfinite(rating)):
+                rating = np.nan
+            amps[t, i] = rating
+
+    return amps
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: the kernel relies on NaN propagation to flag rejected inputs
+    _heat_balance_nb = njit(cache=True)(_heat_balance_loop)
+
+
+def steady_state_thermal_ratings(weather, Diameter, RLo, RHi, Tc, ambient_temps=None):
+    """
+    IEEE-738 steady-state rating of every conductor for one weather state.
+
+    Args:
+        weather: Dict of ambient parameters accepted by ieee738.ConductorParams
+        Diameter: 1-D array of conductor diameters (inches)
+        RLo: 1-D array of resistances at 25 deg C (ohms/ft)
+        RHi: 1-D array of resistances at 50 deg C (ohms/ft)
+        Tc: Maximum operating temperatures (deg C), 1-D or broadcastable
+            against (len(ambient_temps), n) when sweeping
+        ambient_temps: Optional 1-D array of ambient temperatures (deg C)
+            that replaces weather['Ta'] and evaluates them all at once
+
+    Returns:
+        np.ndarray: Ratings in amps, NaN where ieee738 would reject the inputs;
+        shape (len(ambient_temps), n) when ambient_temps is given
+
+    Raises:
+        ValueError: If the weather parameters are invalid for every conductor
+    """
+    Diameter = np.ascontiguousarray(Diameter, dtype=np.float64)
+    RLo = np.ascontiguousarray(RLo, dtype=np.float64)
+    RHi = np.ascontiguousarray(RHi, dtype=np.float64)
+    sweep = ambient_temps is not None
+    if sweep:
+        ambient_temps = np.asarray(ambient_temps, dtype=np.float64)
+        if ambient_temps.size == 0:
+            return np.empty((0, Diameter.shape[0]))
+        weather = {**weather, 'Ta': float(ambient_temps[0])}
+
+    # Validate and coerce the weather once through the reference model
+    probe = ieee738.Conductor(ieee738.ConductorParams(**{
+        **weather,
+        'TLo': T_LO, 'THi': T_HI, 'RLo': 0.0, 'RHi': 0.0,
+        'Diameter': 1.0, 'Tc': T_HI, 'ConductorsPerBundle': 1,
+    }))
+    probe.input_validation()
+    Ta = ambient_temps if sweep else np.array([probe.Ta], dtype=np.float64)
+    Tc = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(Tc, dtype=np.float64), (Ta.shape[0], Diameter.shape[0]))
+    )
+
+    # Weather-only terms
+    He = probe.Elevation
+    Vwind = probe.WindVelocity * 60.0 * 60.0
+    w = ieee738.deg2rad(90 - probe.WindAngleDeg)
+    Kangle = 1.194 - math.sin(w) - 0.194 * math.cos(2 * w) + 0.368 * math.sin(2 * w)
+    Qs, sin_theta = _solar_terms(probe)
+    solar = probe.Absorptivity * Qs * sin_theta
+    Kelev = 1.0 + 3.5e-5 * He - 1.0e-9 * He ** 2
+
+    # The compiled loop wins on call overhead for one weather state; a sweep has
+    # enough elements for NumPy's vectorized pow to be faster
+    kernel = _heat_balance_nb if NUMBA_AVAILABLE and not sweep else _heat_balance_numpy
+    amps = kernel(Ta, float(He), float(Vwind), float(Kangle), float(solar),
+                  float(Kelev), float(probe.Emissivity), Diameter, RLo, RHi, Tc)
+    return amps if sweep else amps[0]
+
+
+if NUMBA_AVAILABLE:
+    # Compile (or load from the on-disk cache) at import, not on the first request
+    _heat_balance_nb(np.zeros(1), 0.0, 0.0, 1.0, 1.0, 1.0, 0.5,
+                     np.ones(1), np.full(1, 1e-5), np.full(1, 1e-5), np.full((1, 1), 75.0))
+else:
+    logger.debug("numba not installed; using NumPy IEEE-738 heat balance")
@@ -15,8 +15,9 @@ payload = {
     "use_lpf": False         # Use nonlinear power flow
 }
 
-# Send POST request
-response = requests.post(
+# Send POST request over a pooled session (reused if more requests are added)
+session = requests.Session()
+response = session.post(
     API_URL,
     headers={"Content-Type": "application/json"},
     json=payload
@@ -6,19 +6,51 @@ with the frontend application.
 """
 
 import json
+import os
 import sys
+from collections import Counter
 from pathlib import Path
 from typing import List, Dict, Any
 
+import numpy as np
+import orjson
+
 # Add backend directory to path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
 
-def example_1_direct_simulation():
+# requests.Session shared by the API examples, created on first use
+_SESSION = None
+
+
+def _get_session():
+    """Shared requests.Session, so repeated API calls reuse pooled keep-alive connections."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        _SESSION = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        _SESSION.mount('http://', adapter)
+        _SESSION.mount('https://', adapter)
+    return _SESSION
+
+
+def _write_json(output_file: Path, payload: Any):
+    """Write payload to output_file as indented JSON, encoded by orjson."""
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
+
+def example_1_direct_simulation(simulator=None):
     """
     Example 1: Direct simulation and JSON export
     Use case: Generating static reports or saving results to disk
+
+    Args:
+        simulator: OutageSimulator to reuse; a new one is created if omitted
     """
     print("\n" + "="*70)
     print("Example 1: Direct Simulation and JSON Export")
@@ -27,7 +59,8 @@ def example_1_direct_simulation():
     from outage_simulator import OutageSimulator
 
     # Initialize simulator
-    simulator = OutageSimulator()
+    if simulator is None:
+        simulator = OutageSimulator()
 
     # Run N-1 contingency for line L0
     print("\n[1] Running N-1 contingency for line L0...")
@@ -35,8 +68,7 @@ def example_1_direct_simulation():
 
     # Save to JSON file
     output_file = backend_dir / "contingency_L0_result.json"
-    with open(output_file, 'w') as f:
-        json.dump(result, f, indent=2)
+    _write_json(output_file, result)
 
     print(f"    [OK] Results saved to: {output_file}")
     print(f"    Success: {result['success']}")
@@ -70,7 +102,7 @@ def example_2_api_request():
 
     try:
         # Send request
-        response = requests.post(
+        response = _get_session().post(
             f"{API_BASE}/outage/simulate",
             headers={"Content-Type": "application/json"},
             json=payload,
@@ -106,10 +138,14 @@ def example_2_api_request():
         return None
 
 
-def example_3_batch_analysis():
+def example_3_batch_analysis(simulator=None, pool=None):
     """
     Example 3: Batch analysis of multiple contingencies
     Use case: Analyzing all N-1 contingencies for the system
+
+    Args:
+        simulator: OutageSimulator to reuse; a new one is created if omitted
+        pool: Worker pool from create_worker_pool(); scenarios run serially if omitted
     """
     print("\n" + "="*70)
     print("Example 3: Batch N-1 Contingency Analysis")
@@ -118,7 +154,8 @@ def example_3_batch_analysis():
     from outage_simulator import OutageSimulator
 
     # Initialize simulator
-    simulator = OutageSimulator()
+    if simulator is None:
+        simulator = OutageSimulator()
 
     # Get all available lines
     available_lines = simulator.get_available_lines()
@@ -133,7 +170,7 @@ def example_3_batch_analysis():
 
     # Run batch analysis
     print(f"\n[2] Running {len(scenarios)} N-1 contingency scenarios...")
-    results = simulator.run_multiple_contingency_scenarios(scenarios)
+    results = simulator.run_multiple_contingency_scenarios(scenarios, pool=pool)
 
     # Analyze results
     print(f"\n[3] Analysis complete!")
@@ -164,18 +201,20 @@ def example_3_batch_analysis():
 
     # Save batch results
     output_file = backend_dir / "batch_contingency_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+    _write_json(output_file, results)
 
     print(f"\n    [OK] Batch results saved to: {output_file}")
 
     return results
 
 
-def example_4_visualization_data():
+def example_4_visualization_data(simulator=None):
     """
     Example 4: Prepare data specifically for frontend visualization
     Use case: Sending optimized data for charts and graphs
+
+    Args:
+        simulator: OutageSimulator to reuse; a new one is created if omitted
     """
     print("\n" + "="*70)
     print("Example 4: Prepare Visualization Data")
@@ -184,13 +223,40 @@ def example_4_visualization_data():
     from outage_simulator import OutageSimulator
 
     # Initialize and run simulation
-    simulator = OutageSimulator()
+    if simulator is None:
+        simulator = OutageSimulator()
     result = simulator.simulate_outage(['L0'])
 
     if not result['success']:
         print("    [X] Simulation failed")
         return None
 
+    # Count line statuses in one pass for the pie chart
+    status_counts = Counter(line['status'] for line in result['loading_changes'])
+
+    # Network graph nodes (deduplicated, in first-seen order), edges and the
+    # loading histogram in a single pass over the lines
+    lines = result['loading_changes']
+    flows = np.fromiter((line['flow_mw'] for line in lines), dtype=np.float64, count=len(lines))
+    widths = np.minimum(np.abs(flows) / 50.0, 10.0).tolist()  # Scale for visualization
+
+    nodes = {}
+    edges = []
+    histogram_loading = []
+    for line, width in zip(lines, widths):
+        nodes[line['bus0']] = None
+        nodes[line['bus1']] = None
+        edges.append({
+            'source': line['bus0'],
+            'target': line['bus1'],
+            'flow': line['flow_mw'],
+            'loading': line['loading_pct'],
+            'status': line['status'],
+            'width': width
+        })
+        if line['is_active'] and not line['is_outaged']:
+            histogram_loading.append(line['loading_pct'])
+
     # Prepare data for different chart types
     visualization_data = {
         # 1. Bar chart: Top 10 most affected lines
@@ -211,42 +277,17 @@ def example_4_visualization_data():
 
         # 2. Pie chart: Distribution of line status
         'pie_chart_status': {
-            'normal': sum(1 for l in result['loading_changes']
-                         if l['status'] == 'normal'),
-            'caution': sum(1 for l in result['loading_changes']
-                          if l['status'] == 'caution'),
-            'high_stress': sum(1 for l in result['loading_changes']
-                              if l['status'] == 'high_stress'),
-            'overloaded': sum(1 for l in result['loading_changes']
-                             if l['status'] == 'overloaded'),
-            'outaged': sum(1 for l in result['loading_changes']
-                          if l['status'] == 'outaged')
+            status: status_counts[status]
+            for status in ('normal', 'caution', 'high_stress', 'overloaded', 'outaged')
         },
 
         # 3. Line graph: Loading distribution
-        'histogram_loading': [
-            line['loading_pct']
-            for line in result['loading_changes']
-            if line['is_active'] and not line['is_outaged']
-        ],
+        'histogram_loading': histogram_loading,
 
         # 4. Network graph: Flow changes
         'network_graph': {
-            'nodes': list(set(
-                [line['bus0'] for line in result['loading_changes']] +
-                [line['bus1'] for line in result['loading_changes']]
-            )),
-            'edges': [
-                {
-                    'source': line['bus0'],
-                    'target': line['bus1'],
-                    'flow': line['flow_mw'],
-                    'loading': line['loading_pct'],
-                    'status': line['status'],
-                    'width': min(abs(line['flow_mw']) / 50, 10)  # Scale for visualization
-                }
-                for line in result['loading_changes']
-            ]
+            'nodes': list(nodes),
+            'edges': edges
         },
 
         # 5. Metrics summary (for dashboard cards)
@@ -264,8 +305,7 @@ def example_4_visualization_data():
 
     # Save visualization data
     output_file = backend_dir / "visualization_data.json"
-    with open(output_file, 'w') as f:
-        json.dump(visualization_data, f, indent=2)
+    _write_json(output_file, visualization_data)
 
     print(f"\n[1] Prepared visualization data:")
     print(f"    Bar chart: {len(visualization_data['bar_chart_loading_changes'])} data points")
@@ -347,17 +387,23 @@ def main():
     print("CONTINGENCY ANALYSIS - FRONTEND INTEGRATION EXAMPLES")
     print("="*70)
 
+    from outage_simulator import OutageSimulator, create_worker_pool
+
+    # Load the network once and share it across the simulation examples
+    simulator = OutageSimulator()
+
     # Example 1: Direct simulation
-    result1 = example_1_direct_simulation()
+    result1 = example_1_direct_simulation(simulator)
 
     # Example 2: API request (requires Flask server running)
     result2 = example_2_api_request()
 
-    # Example 3: Batch analysis
-    result3 = example_3_batch_analysis()
+    # Example 3: Batch analysis, on a pool whose workers load the network once each
+    with create_worker_pool(os.cpu_count() or 1) as pool:
+        result3 = example_3_batch_analysis(simulator, pool)
 
     # Example 4: Visualization data
-    result4 = example_4_visualization_data()
+    result4 = example_4_visualization_data(simulator)
 
     # Example 5: WebSocket streaming (conceptual)
     example_5_websocket_stream()
@@ -2,35 +2,47 @@
 pytest tests for autonomous grid monitor agent
 """
 import pytest
+import copy
+import inspect
+import io
 import json
+import logging
 import os
-import tempfile
-from unittest.mock import Mock, MagicMock, patch
-from agent import AgentState, GridMonitorAgent
+from functools import lru_cache
+
+from typing_extensions import TypedDict
+
+
+@pytest.fixture(scope="module")
+def state_dir(tmp_path_factory):
+    """Directory for tests that need a real state path"""
+    return tmp_path_factory.mktemp("agent_state", numbered=False)
 
 
 class TestAgentState:
     """Test AgentState persistence and management"""
 
-    def test_agent_state_persistence(self, tmp_path):
+    def test_agent_state_persistence(self):
         """Test create, save, load, and assert equality"""
+        from agent import AgentState
+
         # Create a state
         state1 = AgentState()
         state1.history.append({'test': 'data', 'value': 123})
         state1.action_history.append({'action': 'test_action'})
         state1.thresholds['high_loading'] = 85.0
 
-        # Save to temp file
-        test_path = tmp_path / "test_state.json"
-        state1.save(str(test_path))
-
-        # Verify file exists
-        assert test_path.exists()
+        # Save to an in-memory buffer
+        buffer = io.BytesIO()
+        state1.dump(buffer)
+        assert json.loads(buffer.getvalue()) == state1.to_dict()
 
         # Load the state
-        state2 = AgentState.load(str(test_path))
+        buffer.seek(0)
+        state2 = AgentState.read(buffer)
 
         # Assert equality
+        assert state2 == state1
         assert state2.history == state1.history
         assert state2.action_history == state1.action_history
         assert state2.thresholds == state1.thresholds
@@ -38,6 +50,8 @@ class TestAgentState:
 
     def test_agent_state_to_dict(self):
         """Test state serialization to dictionary"""
+        from agent import AgentState
+
         state = AgentState()
         state.history = [{'snapshot': 1}]
         state.action_history = [{'action': 'test'}]
@@ -50,9 +64,11 @@ class TestAgentState:
         assert 'version' in state_dict
         assert state_dict['history'] == [{'snapshot': 1}]
 
-    def test_agent_state_load_nonexistent(self, tmp_path):
+    def test_agent_state_load_nonexistent(self, state_dir):
         """Test loading from non-existent file creates new state"""
-        test_path = tmp_path / "nonexistent.json"
+        from agent import AgentState
+
+        test_path = state_dir / "nonexistent.json"
 
         state = AgentState.load(str(test_path))
 
@@ -61,79 +77,196 @@ class TestAgentState:
         assert len(state.action_history) == 0
 
 
-class TestGridMonitorAgent:
-    """Test GridMonitorAgent core functionality"""
+# Ratings returned by the stub calculator for every weather state
+STUB_RATINGS = {
+    'lines': [
+        {
+            'name': 'L1',
+            'loading_pct': 95.0,
+            'rating_mva': 100.0,
+            'flow_mva': 95.0,
+            'margin_mva': 5.0
+        },
+        {
+            'name': 'L2',
+            'loading_pct': 50.0,
+            'rating_mva': 100.0,
+            'flow_mva': 50.0,
+            'margin_mva': 50.0
+        }
+    ],
+    'summary': {
+        'avg_loading': 72.5,
+        'max_loading': 95.0,
+        'total_lines': 2
+    }
+}
+
+# One overloaded and one high-stress line
+HIGH_LOADING_DATA = {
+    'lines': [
+        {
+            'name': 'L1',
+            'loading_pct': 105.0,
+            'rating_mva': 100.0,
+            'flow_mva': 105.0,
+            'margin_mva': -5.0
+        },
+        {
+            'name': 'L2',
+            'loading_pct': 95.0,
+            'rating_mva': 100.0,
+            'flow_mva': 95.0,
+            'margin_mva': 5.0
+        }
+    ],
+    'summary': {
+        'avg_loading': 100.0
+    }
+}
 
-    @pytest.fixture
-    def mock_calculator(self):
-        """Create mock rating calculator"""
-        calculator = Mock()
-        calculator.calculate_all_line_ratings = Mock(return_value={
-            'lines': [
-                {
-                    'name': 'L1',
-                    'loading_pct': 95.0,
-                    'rating_mva': 100.0,
-                    'flow_mva': 95.0,
-                    'margin_mva': 5.0
-                },
-                {
-                    'name': 'L2',
-                    'loading_pct': 50.0,
-                    'rating_mva': 100.0,
-                    'flow_mva': 50.0,
-                    'margin_mva': 50.0
-                }
-            ],
-            'summary': {
-                'avg_loading': 72.5,
-                'max_loading': 95.0,
-                'total_lines': 2
-            }
-        })
-        return calculator
 
-    @pytest.fixture
-    def agent(self, mock_calculator, tmp_path):
-        """Create agent with mock calculator and temp state"""
-        state = AgentState()
-        config = {
-            'decision_log_path': str(tmp_path / "test_decisions.log"),
-            'state_path': str(tmp_path / "test_state.json")
-        }
-        return GridMonitorAgent(mock_calculator, state=state, config=config)
-
-    def test_detect_high_loading(self, agent):
-        """Test detection of high loading issue"""
-        # Synthetic data with one line > threshold
-        current_data = {
-            'lines': [
-                {
-                    'name': 'L1',
-                    'loading_pct': 95.0,
-                    'rating_mva': 100.0,
-                    'flow_mva': 95.0,
-                    'margin_mva': 5.0
-                }
-            ],
-            'summary': {
-                'avg_loading': 95.0
+def _payload(loading_pct):
+    """Grid data with a single line L1 at the given loading"""
+    return {
+        'lines': [
+            {
+                'name': 'L1',
+                'loading_pct': loading_pct,
+                'rating_mva': 100.0,
+                'flow_mva': loading_pct,
+                'margin_mva': 100.0 - loading_pct
             }
-        }
+        ],
+        'summary': {'avg_loading': loading_pct}
+    }
+
+
+class RecommendationDict(TypedDict):
+    """Shape of a GridMonitorAgent.generate_recommendations entry"""
+    id: str
+    priority: int
+    action: str
+    estimated_impact: dict
+    confidence: float
+    justification: str
+
+
+@lru_cache(maxsize=None)
+def _recommendation_adapter():
+    """pydantic validator for RecommendationDict, built on first use"""
+    from pydantic import TypeAdapter
+
+    return TypeAdapter(RecommendationDict)
+
+
+class StubCalculator:
+    """
+    Rating calculator stand-in that records its calls
+
+    Only the RatingCalculator methods the agent uses are defined, with the
+    same signatures, so a misspelled or mis-called method fails the test.
+    """
+
+    RESULT = STUB_RATINGS
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget previous calls"""
+        self.call_count = 0
+        self.last_weather = None
+
+    def calculate_all_line_ratings(self, weather_params):
+        self.call_count += 1
+        self.last_weather = weather_params
+        return self.RESULT
+
+
+@pytest.fixture(scope="module")
+def mock_calculator():
+    """Create stub rating calculator, shared by the module"""
+    return StubCalculator()
+
+
+@pytest.fixture(scope="module")
+def initial_state():
+    """Agent state every test starts from"""
+    from agent import AgentState
+
+    return AgentState()
+
 
-        issues = agent.monitor_grid_state(current_data)
+@pytest.fixture(scope="module")
+def agent_template(mock_calculator, initial_state, tmp_path_factory):
+    """Create one agent with mock calculator and temp paths for the module"""
+    from agent import GridMonitorAgent
 
-        # Should detect high loading
-        assert len(issues) > 0
-        high_loading_issues = [i for i in issues if 'loading' in i['id'].lower()]
-        assert len(high_loading_issues) > 0
+    agent_dir = tmp_path_factory.mktemp("agent")
+    config = {
+        'decision_log_path': str(agent_dir / "test_decisions.log"),
+        'state_path': str(agent_dir / "test_state.json")
+    }
+    agent = GridMonitorAgent(mock_calculator, state=copy.deepcopy(initial_state), config=config)
+
+    # The decision logger is process-wide and only gets a file handler for the
+    # first agent created; make sure this module's log file receives entries
+    log_path = os.path.abspath(config['decision_log_path'])
+    handler = None
+    if not any(getattr(h, 'baseFilename', None) == log_path
+               for h in agent.decision_logger.handlers):
+        handler = logging.FileHandler(log_path)
+        agent.decision_logger.addHandler(handler)
+
+    yield agent
+
+    if handler is not None:
+        agent.decision_logger.removeHandler(handler)
+        handler.close()
+
+
+@pytest.fixture
+def agent(agent_template, initial_state, mock_calculator):
+    """Shared agent with a fresh copy of the initial state for each test"""
+    agent_template.state = copy.deepcopy(initial_state)
+    mock_calculator.reset()
+    return agent_template
+
+
+@pytest.fixture(scope="module")
+def high_loading_issues(agent_template, initial_state):
+    """Issues detected once in HIGH_LOADING_DATA"""
+    agent_template.state = copy.deepcopy(initial_state)
+    return agent_template.monitor_grid_state(HIGH_LOADING_DATA)
+
+
+class TestGridMonitorAgent:
+    """Test GridMonitorAgent core functionality"""
+
+    @pytest.mark.parametrize("loading_pct,expected_severity", [
+        (95.0, 'high'),
+        (105.0, 'critical'),
+    ])
+    def test_loading_detection(self, agent, loading_pct, expected_severity):
+        """Test detection and confidence of high and critical loading issues"""
+        issues = agent.monitor_grid_state(_payload(loading_pct))
+
+        # Should detect exactly one loading issue
+        loading_issues = [i for i in issues if 'loading' in i['id'].lower()]
+        assert len(loading_issues) == 1
 
         # Check issue structure
-        issue = high_loading_issues[0]
-        assert issue['severity'] in ['high', 'critical']
+        issue = loading_issues[0]
+        assert issue['severity'] == expected_severity
         assert 'L1' in issue['affected_lines']
         assert issue['confidence'] > 0.0
 
+        # All issues should have confidence
+        for issue in issues:
+            assert 'confidence' in issue
+            assert 0.0 <= issue['confidence'] <= 1.0
+
     def test_prediction_uses_ieee738(self, agent, mock_calculator):
         """Test that predict_future_states calls IEEE 738 calculator"""
         weather_forecast = [
@@ -148,8 +281,8 @@ class TestGridMonitorAgent:
         result = agent.predict_future_states(weather_forecast)
 
         # Verify calculator was called
-        assert mock_calculator.calculate_all_line_ratings.called
-        call_args = mock_calculator.calculate_all_line_ratings.call_args[0][0]
+        assert mock_calculator.call_count == 1
+        call_args = mock_calculator.last_weather
         assert 'Ta' in call_args
         assert call_args['Ta'] == 30
 
@@ -184,22 +317,11 @@ class TestGridMonitorAgent:
 
         assert len(recommendations) > 0
 
-        # Validate first recommendation structure
+        # Validate first recommendation structure and types in one pass
         rec = recommendations[0]
-        assert 'id' in rec
-        assert 'priority' in rec
-        assert 'action' in rec
-        assert 'estimated_impact' in rec
-        assert 'confidence' in rec
-        assert 'justification' in rec
-
-        # Validate types
-        assert isinstance(rec['id'], str)
-        assert isinstance(rec['priority'], int)
-        assert isinstance(rec['action'], str)
-        assert isinstance(rec['estimated_impact'], dict)
+        _recommendation_adapter().validate_python(rec, strict=True)
+        # Strict mode still accepts an int where a float is declared
         assert isinstance(rec['confidence'], float)
-        assert isinstance(rec['justification'], str)
 
         # Validate priority is 1-5
         assert 1 <= rec['priority'] <= 5
@@ -229,53 +351,43 @@ class TestGridMonitorAgent:
         # Should be lowered from the raised threshold
         assert agent.state.thresholds['high_loading'] < after_rejection
 
+    def test_learning_batch_matches_single_calls(self, agent):
+        """Test that batch learning applies each outcome in order"""
+        initial_threshold = agent.state.thresholds['high_loading']
+
+        # Rejection raises the threshold, the unsuccessful action lowers it back
+        agent.learn_from_outcomes_batch([
+            ('test_action_1', {'result': 'rejected', 'notes': 'Too aggressive'}),
+            ('test_action_2', {'result': 'accepted', 'success': False}),
+        ])
+
+        assert agent.state.thresholds['high_loading'] == initial_threshold
+        assert [a['action_id'] for a in agent.state.action_history] == \
+            ['test_action_1', 'test_action_2']
+
     def test_history_window_management(self, agent):
         """Test that history is trimmed to window size"""
         window_size = int(agent.state.thresholds['historical_window'])
 
         # Add more snapshots than window size
+        payload = {'lines': [], 'summary': {'avg_loading': 0.0}}
         for i in range(window_size + 5):
-            agent.monitor_grid_state({
-                'lines': [],
-                'summary': {'avg_loading': 50.0 + i}
-            })
+            payload['summary']['avg_loading'] = 50.0 + i
+            agent.monitor_grid_state(payload)
 
-        # History should be trimmed to window size
+        # History should be trimmed to window size, keeping the latest snapshots
         assert len(agent.state.history) == window_size
+        assert agent.state.history[0]['summary']['avg_loading'] == 55.0
 
     def test_action_history_bounded(self, agent):
         """Test that action history is kept bounded"""
-        # Add many feedback entries
-        for i in range(150):
-            agent.learn_from_outcomes(f'action_{i}', {
-                'result': 'accepted',
-                'success': True
-            })
-
-        # Should be bounded to 100
-        assert len(agent.state.action_history) <= 100
-
-    def test_confidence_calculation(self, agent):
-        """Test that confidence values are properly calculated"""
-        current_data = {
-            'lines': [
-                {
-                    'name': 'L1',
-                    'loading_pct': 105.0,
-                    'rating_mva': 100.0,
-                    'flow_mva': 105.0,
-                    'margin_mva': -5.0
-                }
-            ],
-            'summary': {'avg_loading': 105.0}
-        }
-
-        issues = agent.monitor_grid_state(current_data)
+        # Pre-populate past the bound, then add one more feedback entry
+        agent.state.action_history.extend({'action_id': 'action_' + str(i)} for i in range(150))
+        agent.learn_from_outcomes('action_150', {'result': 'accepted', 'success': True})
 
-        # All issues should have confidence
-        for issue in issues:
-            assert 'confidence' in issue
-            assert 0.0 <= issue['confidence'] <= 1.0
+        # Should be bounded to 100, keeping the most recent entries
+        assert len(agent.state.action_history) <= 100
+        assert agent.state.action_history[-1]['action_id'] == 'action_150'
 
     def test_heartbeat_loop(self, agent):
         """Test heartbeat returns proper status"""
@@ -287,21 +399,25 @@ class TestGridMonitorAgent:
         assert 'action_history_size' in status
         assert 'thresholds' in status
 
-    def test_decision_logging(self, agent, tmp_path):
-        """Test that decisions are logged to file"""
-        # Decision log path is set in the fixture's config
-        log_path = tmp_path / "test_decisions.log"
+    def test_decision_logging(self, agent_template, high_loading_issues):
+        """Test that critical overloads are written to the decision log"""
+        critical = [i for i in high_loading_issues if i['severity'] == 'critical']
+        assert len(critical) == 1
+        assert critical[0]['affected_lines'] == ['L1']
 
-        # Trigger a decision
-        current_data = {
-            'lines': [{'name': 'L1', 'loading_pct': 105.0, 'rating_mva': 100.0, 'flow_mva': 105.0, 'margin_mva': -5.0}],
-            'summary': {'avg_loading': 105.0}
-        }
-        agent.monitor_grid_state(current_data)
+        # Each log line ends with the JSON decision entry
+        with open(agent_template.config['decision_log_path']) as f:
+            entries = [json.loads(line[line.index('{'):]) for line in f if '{' in line]
+
+        logged = [e for e in entries if e['action'] == 'critical_overload_detected']
+        assert any('L1' in e['details']['affected_lines'] for e in logged)
+
+    def test_stub_matches_rating_calculator(self):
+        """Test that the stub keeps the RatingCalculator method signatures"""
+        from rating_calculator import RatingCalculator
 
-        # The fixture already sets the log path, so it should exist
-        # Check if the decision was logged (the fixture sets the path correctly)
-        assert len(agent.state.history) > 0
+        assert inspect.signature(StubCalculator.calculate_all_line_ratings) == \
+            inspect.signature(RatingCalculator.calculate_all_line_ratings)
 
 
 class TestRateLimiting:
@@ -320,8 +436,10 @@ class TestRateLimiting:
         current_time = time.time()
         request_times.append(current_time)
 
-        # Count recent requests
-        recent_requests = sum(1 for t in request_times if current_time - t < 1.0)
+        # Drop requests older than the one-second window, then count the rest
+        while request_times and current_time - request_times[0] >= 1.0:
+            request_times.popleft()
+        recent_requests = len(request_times)
 
         # Should allow if under limit
         assert recent_requests <= max_requests_per_second
@@ -0,0 +1,44 @@
+"""
+pytest tests for the line loading kernels
+"""
+import numpy as np
+import pytest
+
+import loading_kernels
+from loading_kernels import LINE_STATUS_NAMES, compute_line_stats
+
+# Flows against degenerate and regular ratings: zero, NaN and negative s_nom
+# must give zero loading and 'normal' status on every path
+FLOW_MW = np.array([10.0, 10.0, 10.0, 95.0, -95.0])
+S_NOM = np.array([0.0, np.nan, -50.0, 100.0, 100.0])
+
+
+def _paths():
+    """Every implementation of compute_line_stats available here, by name"""
+    paths = {
+        'numpy': loading_kernels._compute_line_stats_numpy,
+        'python': loading_kernels._compute_line_stats_loop,
+    }
+    if loading_kernels.NUMBA_AVAILABLE:
+        paths['numba'] = loading_kernels._compute_line_stats_nb
+    return paths
+
+
+@pytest.mark.parametrize("kernel", list(_paths().values()), ids=list(_paths()))
+def test_kernels_agree_on_degenerate_ratings(kernel):
+    """Test that every path matches the NumPy reference, including bad s_nom"""
+    expected = loading_kernels._compute_line_stats_numpy(FLOW_MW, S_NOM)
+    result = kernel(FLOW_MW, S_NOM)
+
+    for got, want in zip(result, expected):
+        np.testing.assert_array_equal(got, want)
+
+
+def test_degenerate_ratings_are_normal():
+    """Test that lines without a usable rating report zero loading"""
+    flow_mva, loading_pct, codes, counts = compute_line_stats(FLOW_MW, S_NOM)
+
+    np.testing.assert_array_equal(loading_pct[:3], 0.0)
+    assert [LINE_STATUS_NAMES[c] for c in codes] == \
+        ['normal', 'normal', 'normal', 'overloaded', 'overloaded']
+    assert counts.sum() == len(FLOW_MW)